@@ -5,11 +5,70 @@ import re
 
 from gitma_canspin.annotation import Annotation
 
-from typing import Union, Tuple, List, Dict
+from typing import Union, Tuple, List, Dict, Iterator
 
 import logging
 logger = logging.getLogger(__name__)
 
+# trained pipeline components, which are not loaded since only the tokenizer output is used
+spacy_excluded_components = [
+    'tok2vec', 'tagger', 'morphologizer', 'parser', 'lemmatizer', 'trainable_lemmatizer',
+    'attribute_ruler', 'ner', 'senter'
+]
+
+# spacy models loaded by get_spacy_df by language
+loaded_spacy_models: Dict[str, spacy.Language] = {}
+
+# texts are tokenized in chunks of at least this length, see split_text
+spacy_chunk_len = 100000
+
+# a single space between two non-space characters, at which spacys tokenizer always splits
+chunk_border_pattern = re.compile(r'(?<=\S) (?=\S)')
+
+def split_text(text: str, chunk_len: Union[int, None] = None) -> Iterator[str]:
+    """Splits a text into chunks of at least chunk_len characters, which end behind a space matched by chunk_border_pattern.
+    Since spacys tokenizer splits there anyway, the tokens of the chunks equal the tokens of the whole text.
+
+    Args:
+        text (str): The text to be split.
+        chunk_len (int, optional): The minimal length of the chunks. Defaults to None, in which case spacy_chunk_len is used.
+
+    Yields:
+        str: The next chunk of the text.
+    """
+    chunk_len = chunk_len if chunk_len else spacy_chunk_len
+    chunk_start = 0
+    while len(text) - chunk_start > chunk_len:
+        chunk_border = chunk_border_pattern.search(text, chunk_start + chunk_len)
+        if not chunk_border:
+            break
+        yield text[chunk_start:chunk_border.end()]
+        chunk_start = chunk_border.end()
+    yield text[chunk_start:]
+
+def tokenize_text(nlp: spacy.Language, text: str, chunk_len: Union[int, None] = None) -> spacy.tokens.Doc:
+    """Tokenizes a text in chunks created by split_text and joins them to one document
+    with continuous token indices and text pointers.
+
+    Args:
+        nlp (spacy.Language): The loaded spacy model.
+        text (str): The text to be tokenized.
+        chunk_len (int, optional): The minimal length of the chunks. Defaults to None, in which case spacy_chunk_len is used.
+
+    Raises:
+        ValueError: If the text is longer than the model's max_length.
+
+    Returns:
+        spacy.tokens.Doc: The tokenized text.
+    """
+    # the chunks are shorter than the text, so spacys own length check is applied to the whole text here
+    if len(text) > nlp.max_length:
+        raise ValueError(
+            f'Text of length {len(text)} exceeds the maximum of {nlp.max_length} characters accepted for tokenization. '
+            'Increase nlp_max_text_len to tokenize longer texts.')
+
+    return spacy.tokens.Doc.from_docs(list(nlp.pipe(split_text(text, chunk_len=chunk_len))), ensure_whitespace=False)
+
 def get_spacy_df(text: str, spacy_model_lang: str = 'German', nlp_max_text_len: int = None) -> pd.DataFrame:
     """Generates a table with the token and their position in the given text by using `spacy`.
 
@@ -32,7 +91,7 @@ def get_spacy_df(text: str, spacy_model_lang: str = 'German', nlp_max_text_len:
         """
         all_prefixes_re = spacy.util.compile_prefix_regex(tuple(list(nlp.Defaults.prefixes) + ['-','‐','˗','‒','–','—','―','−','─']))
         loaded_model.tokenizer.prefix_search = all_prefixes_re.search
-    
+
     lang_dict = {
         'German': {'model': 'de_core_news_sm', 'customizations': None},
         'English': {'model': 'en_core_web_sm', 'customizations': None},
@@ -41,26 +100,35 @@ def get_spacy_df(text: str, spacy_model_lang: str = 'German', nlp_max_text_len:
         'Spanish': {'model': 'es_core_news_sm', 'customizations': _fix_spanish_tokenization}
     }
     
-    try:
-        nlp = spacy.load(lang_dict[spacy_model_lang]['model'])
-    except OSError:
-        logger.info('Downloading spacy model "' + lang_dict[spacy_model_lang]['model'] + '" for tokenization...')
-        from spacy.cli import download
-        download(lang_dict[spacy_model_lang]['model'])
-        nlp = spacy.load(lang_dict[spacy_model_lang]['model'])
-    if spacy_model_lang == "Multilingual":
-        nlp.add_pipe("sentencizer")
-    nlp.max_length = nlp_max_text_len if nlp_max_text_len else nlp.max_length
+    # models are loaded and customized once per language and reused by later calls
+    nlp = loaded_spacy_models.get(spacy_model_lang)
+    if nlp is None:
+        try:
+            nlp = spacy.load(lang_dict[spacy_model_lang]['model'], exclude=spacy_excluded_components)
+        except OSError:
+            logger.info('Downloading spacy model "' + lang_dict[spacy_model_lang]['model'] + '" for tokenization...')
+            from spacy.cli import download
+            download(lang_dict[spacy_model_lang]['model'])
+            nlp = spacy.load(lang_dict[spacy_model_lang]['model'], exclude=spacy_excluded_components)
+        if spacy_model_lang == "Multilingual":
+            nlp.add_pipe("sentencizer")
+
+        if lang_dict[spacy_model_lang]['customizations']:
+            lang_dict[spacy_model_lang]['customizations'](nlp)
+
+        loaded_spacy_models[spacy_model_lang] = nlp
+
+    # the max length is reset to spacys default value, if no value is given, since the model may have been used before
+    nlp.max_length = nlp_max_text_len if nlp_max_text_len else 1000000
     
-    if lang_dict[spacy_model_lang]['customizations']:
-        lang_dict[spacy_model_lang]['customizations'](nlp)
-    
-    doc = nlp(text)
+    doc = tokenize_text(nlp=nlp, text=text)
 
-    tok_exp = nlp.tokenizer.explain(text)
-    assert [t.text for t in doc if not t.is_space] == [t[1] for t in tok_exp]
-    for t in tok_exp:
-        logger.debug(f'{t[1]} --- {t[0]}')
+    # tokenizer.explain tokenizes the text a second time in python, so it is only run for debug output
+    if logger.isEnabledFor(logging.DEBUG):
+        tok_exp = nlp.tokenizer.explain(text)
+        assert [t.text for t in doc if not t.is_space] == [t[1] for t in tok_exp]
+        for t in tok_exp:
+            logger.debug(f'{t[1]} --- {t[0]}')
 
     lemma_list = []
 
@@ -139,7 +207,7 @@ def create_basic_token_tsv(
                                           nlp_max_text_len=nlp_max_text_len)
         
     # keep linebreaks for tsv export
-    lemma_df.loc[:, 'Token'] = lemma_df['Token'].apply(lambda x: x.replace('\n', '\\n'))
+    lemma_df.loc[:, 'Token'] = lemma_df['Token'].str.replace('\n', '\\n', regex=False)
 
     lemma_df.to_csv(
         path_or_buf=f'{created_file_name}.tsv' if created_file_name else 'basic_token_table.tsv',
@@ -259,6 +327,8 @@ def create_annotated_tei(
 
     NSMAP = {None: TEI_NS, 'CS1': CS1_NS}
 
+    ANNOTATION_ATTRIBUTE = CS1 + 'annotation'
+
     tei_el = etree.Element(TEI + 'TEI', nsmap=NSMAP)
     tei_header_el = etree.SubElement(tei_el, TEI + 'teiHeader')
     text_el = etree.SubElement(tei_el, TEI + 'text')
@@ -276,19 +346,20 @@ def create_annotated_tei(
             tree_or_element (etree.Elementree or etree.Element): LXML xml element object.
             fix_punctuation (bool, optional): Apply punctuation correction function, which is also used when output string is saved to file.
         """
-        xml = etree.tostring(element_or_tree=tree_or_element, pretty_print=True, xml_declaration=True, encoding='utf-8').decode()
+        xml = etree.tostring(element_or_tree=tree_or_element, pretty_print=True, xml_declaration=True, encoding='utf-8')
         xml = _fix_punctuation(xml) if fix_punctuation else xml
-        print(xml, end='')
+        print(xml.decode(), end='')
 
-    def _fix_punctuation(xml_string: str) -> str:
+    def _fix_punctuation(xml_string: bytes) -> bytes:
         """Helper function to delete spaces that were added to the string in the previous processing step 
         because punctuation marks are also tokens and tokens are usually seperated by spaces.
+        The corrections are applied to the utf-8 encoded xml, so it does not have to be decoded.
 
         Args:
-            xml_string (str): Input string representation of xml tree or element.
+            xml_string (bytes): Input utf-8 encoded representation of xml tree or element.
         
         Returns:
-            str: Input xml string with corrections applied.
+            bytes: Input xml bytes with corrections applied.
         """
         corrections = [
             (r' \.', '.'),
@@ -303,7 +374,7 @@ def create_annotated_tei(
         ]
 
         for correction in corrections:
-            xml_string = re.sub(correction[0], correction[1], xml_string)
+            xml_string = re.sub(correction[0].encode('utf-8'), correction[1].encode('utf-8'), xml_string)
         
         return xml_string
 
@@ -344,7 +415,7 @@ def create_annotated_tei(
             continue
         if row['Tag'] != 'O':
             if row['Tag'].startswith('B-'):
-                _last_sibling_element = etree.SubElement((_paragraph_list[-1] if insert_paragraphs else body_el), CS1 + row['Tag'][2:], attrib={CS1 + 'annotation': row['Annotation_ID']})
+                _last_sibling_element = etree.SubElement((_paragraph_list[-1] if insert_paragraphs else body_el), CS1 + row['Tag'][2:], attrib={ANNOTATION_ATTRIBUTE: row['Annotation_ID']})
                 if idx < (len(tsv_data_df.index) - 1):
                     if tsv_data_df.iloc[idx + 1]['Tag'].startswith('I-'):
                         _last_sibling_element.text = f"{row['Token']} " if _last_sibling_element.text is None else _last_sibling_element.text + f"{row['Token']} "
@@ -374,8 +445,8 @@ def create_annotated_tei(
                     body_el.text = f"{row['Token']} " if body_el.text is None else body_el.text + f"{row['Token']} "
 
     tree = etree.ElementTree(tei_el)
-    tree_string = etree.tostring(element_or_tree=tree, pretty_print=True, xml_declaration=True, encoding='utf-8').decode()
+    tree_string = etree.tostring(element_or_tree=tree, pretty_print=True, xml_declaration=True, encoding='utf-8')
     tree_string = _fix_punctuation(tree_string)
 
-    with open(f'{created_file_name}.xml', 'w', encoding='utf-8') as export_file:
+    with open(f'{created_file_name}.xml', 'wb') as export_file:
         export_file.write(tree_string)
@@ -1,6 +1,7 @@
 import os
 import math
-from typing import Union, Dict, List, Tuple, Literal, Generator, Any
+from collections import Counter
+from typing import Union, Dict, List, Tuple, Literal, Generator, Any, Iterable
 
 # defines some frequently used file paths
 module_path: str = os.path.dirname(os.path.abspath(__file__))
@@ -123,6 +124,23 @@ def reduce_decimal_place(f: float, length: int) -> float:
 def prevent_division_by_zero(a: int, b: int) -> Union[float, int]:
     return a / b if b else 0
 
+def sum_class_counts(class_counts: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    # Counter.update keeps classes with zero instances, unlike Counter addition
+    total: Counter = Counter()
+    for counts in class_counts:
+        total.update(counts)
+    return dict(total)
+
+def sum_word_lists(word_lists: Iterable[Dict[str, Dict[str, int]]]) -> Dict[str, Dict[str, int]]:
+    totals: Dict[str, Counter] = {}
+    for word_list in word_lists:
+        for classname, token_counts in word_list.items():
+            totals.setdefault(classname, Counter()).update(token_counts)
+    return {
+        classname: dict(sorted(token_counts.items(), key=lambda x: int(x[1]), reverse=True))
+        for classname, token_counts in totals.items()
+    }
+
 def translate_dict(input: dict, translation: dict) -> dict:
     translated: dict = dict([(translation.get(k, k), v) for k, v in input.items()])
     for key, value in translated.items():
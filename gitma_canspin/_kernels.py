@@ -0,0 +1,35 @@
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+def best_match(start1: np.ndarray, end1: np.ndarray, start2: np.ndarray, end2: np.ndarray) -> np.ndarray:
+    """Numba compiled version of `gitma_canspin._metrics._best_match_numpy`.
+
+    Args:
+        start1 (np.ndarray): Start points of the first annotations.
+        end1 (np.ndarray): End points of the first annotations.
+        start2 (np.ndarray): Start points of the second annotations.
+        end2 (np.ndarray): End points of the second annotations.
+
+    Returns:
+        np.ndarray: Index of the best matching second annotation per first annotation, -1 if none overlaps.
+    """
+    no_match = np.iinfo(np.int64).max
+    best_matches = np.full(start1.size, -1, np.int64)
+    for i in prange(start1.size):
+        best_span = no_match
+        best_index = np.int64(-1)
+        for j in range(start2.size):
+            overlapping = (
+                ((start1[i] <= start2[j]) & (start2[j] < end1[i]))
+                | ((start1[i] < end2[j]) & (end2[j] <= end1[i]))
+                | ((start2[j] < start1[i]) & (end2[j] > end1[i]))
+            )
+            span = abs(start2[j] - start1[i]) + abs(end2[j] - end1[i])
+            # the running best match is updated by integer masks instead of a branch
+            better = np.int64(overlapping & (span < best_span))
+            best_span = better * span + (1 - better) * best_span
+            best_index = better * j + (1 - better) * best_index
+        best_matches[i] = best_index
+    return best_matches
@@ -2,62 +2,12 @@ import os
 import numpy as np
 import pandas as pd
 import textwrap
-from typing import List, Tuple
+from collections import Counter
+from typing import Callable, List, Tuple
 from gitma_canspin.annotation import Annotation
 from gitma_canspin.annotation_collection import AnnotationCollection
 
 
-def filter_ac_by_tag(
-        ac1: AnnotationCollection,
-        ac2: AnnotationCollection,
-        tag_filter: list = None,
-        filter_both_ac: bool = True) -> Tuple[List[Annotation]]:
-    """Returns lists of annotations filtered by tags.
-    If `filter_both_ac=False` only the first collection's annotations get filtered.
-
-    Args:
-        ac1 (AnnotationCollection): First annotation collection.
-        ac2 (AnnotationCollection): Second annotation collection.
-        tag_filter (list, optional): The list of tags to be included. Defaults to None.
-        filter_both_ac (bool, optional): If `True` both collections get filtered . Defaults to True.
-
-    Returns:
-        Tuple[List[Annotation]]: Two filtered list of annotations.
-    """
-    if tag_filter:
-        ac1_annotations = [
-            an for an in ac1.annotations if an.tag.name in tag_filter]
-        if filter_both_ac:
-            ac2_annotations = [
-                an for an in ac2.annotations if an.tag.name in tag_filter]
-        else:
-            ac2_annotations = ac2.annotations
-    else:
-        ac1_annotations = ac1.annotations
-        ac2_annotations = ac2.annotations
-
-    return ac1_annotations, ac2_annotations
-
-
-def get_same_text(
-    annotation_list1: List[Annotation],
-    annotation_list2: List[Annotation]) -> Tuple[List[Annotation]]:
-    """All text parts annotated only by one annotator get excluded.
-
-    Args:
-        annotation_list1 (List[Annotation]): Annotations from first collection.
-        annotation_list2 (List[Annotation]): Annotations from second collection.
-
-    Returns:
-        Tuple[List[Annotation]]: Annotations from both collections.
-    """
-    ac1 = [an for an in annotation_list1 if an.start_point <=
-           annotation_list2[-1].start_point]
-    ac2 = [an for an in annotation_list2 if an.start_point <=
-           annotation_list1[-1].end_point]
-    return ac1, ac2
-
-
 def test_max_overlap(
     silver_annotation: Annotation,
     second_annotator_annotations: List[Annotation]) -> Annotation:
@@ -191,6 +141,32 @@ class EmptyAnnotation:
         self.properties = property_dict
 
 
+def _best_match_numpy(start1: np.ndarray, end1: np.ndarray, start2: np.ndarray, end2: np.ndarray) -> np.ndarray:
+    """For every span in the first span arrays returns the index of the best matching overlapping span in the second span arrays.
+    Overlap is tested like in `test_overlap`, the best match is chosen like in `test_max_overlap`.
+
+    Args:
+        start1 (np.ndarray): Start points of the first annotations.
+        end1 (np.ndarray): End points of the first annotations.
+        start2 (np.ndarray): Start points of the second annotations.
+        end2 (np.ndarray): End points of the second annotations.
+
+    Returns:
+        np.ndarray: Index of the best matching second annotation per first annotation, -1 if none overlaps.
+    """
+    best_matches = np.full(start1.size, -1, np.int64)
+    for i in range(start1.size):
+        overlapping = (
+            ((start1[i] <= start2) & (start2 < end1[i]))
+            | ((start1[i] < end2) & (end2 <= end1[i]))
+            | ((start2 < start1[i]) & (end2 > end1[i]))
+        )
+        if overlapping.any():
+            spans = np.abs(start2 - start1[i]) + np.abs(end2 - end1[i])
+            best_matches[i] = np.where(overlapping, spans, np.iinfo(np.int64).max).argmin()
+    return best_matches
+
+
 def get_annotation_pairs(
         ac1: AnnotationCollection,
         ac2: AnnotationCollection,
@@ -212,34 +188,68 @@ def get_annotation_pairs(
     Returns:
         List[Tuple[Annotation]]: List of paired annotations.
     """
-    ac1_annotations, ac2_annotations = filter_ac_by_tag(ac1=ac1, ac2=ac2, tag_filter=tag_filter,
-                                                        filter_both_ac=filter_both_ac)
-    ac1_annotations, ac2_annotations = get_same_text(
-        ac1_annotations, ac2_annotations)
+    ac1._cache_arrays()
+    ac2._cache_arrays()
+
+    # the annotations are selected by their positions in the collections, the tag filter is applied to the
+    # first collection only, unless filter_both_ac is True
+    if tag_filter:
+        ac1_indices = ac1._tag_indices(tag_filter)
+        ac2_indices = ac2._tag_indices(tag_filter) if filter_both_ac else np.arange(len(ac2))
+    else:
+        ac1_indices = np.arange(len(ac1))
+        ac2_indices = np.arange(len(ac2))
+
+    # excludes text parts annotated only by one annotator: annotations starting behind the other collection's
+    # last annotation
+    ac1_starts, ac1_ends = ac1._starts[ac1_indices], ac1._ends[ac1_indices]
+    ac2_starts = ac2._starts[ac2_indices]
+    ac1_same_text = ac1_starts <= ac2_starts[-1]
+    ac2_indices = ac2_indices[ac2_starts <= ac1_ends[-1]]
+    ac1_indices = ac1_indices[ac1_same_text]
+
+    ac1_annotations = [ac1.annotations[index] for index in ac1_indices]
+    ac2_annotations = [ac2.annotations[index] for index in ac2_indices]
 
     # removes all annotations without the given property
     if property_filter:
-        ac1_annotations = [
-            an for an in ac1_annotations
-            if property_filter in an.properties             # test if property exists
-            and len(an.properties[property_filter]) > 0     # test if property is annotated
-        ]
-        ac2_annotations = [
-            an for an in ac2_annotations
-            if property_filter in an.properties             # test if property exists
-            and len(an.properties[property_filter]) > 0     # test if property is annotated
-        ]
+        ac1_has_property = np.fromiter(
+            (
+                property_filter in an.properties                # test if property exists
+                and len(an.properties[property_filter]) > 0     # test if property is annotated
+                for an in ac1_annotations
+            ), dtype=bool, count=len(ac1_annotations))
+        ac2_has_property = np.fromiter(
+            (
+                property_filter in an.properties                # test if property exists
+                and len(an.properties[property_filter]) > 0     # test if property is annotated
+                for an in ac2_annotations
+            ), dtype=bool, count=len(ac2_annotations))
+        ac1_indices = ac1_indices[ac1_has_property]
+        ac2_indices = ac2_indices[ac2_has_property]
+        ac1_annotations = [ac1.annotations[index] for index in ac1_indices]
+        ac2_annotations = [ac2.annotations[index] for index in ac2_indices]
 
     pair_list = []
     missing_an2_annotations = 0
 
-    for an1 in ac1_annotations:
-        # collect all overlapping annotations
-        overlapping_annotations = [
-            an2 for an2 in ac2_annotations if test_overlap(an1, an2)]
+    # the numba kernel is imported on first use, since importing numba is slow
+    try:
+        from gitma_canspin._kernels import best_match
+    except ImportError:
+        best_match = _best_match_numpy
+
+    # find the best matching annotation in ac2 for every annotation in ac1 on the cached span arrays
+    best_matches = best_match(
+        ac1._starts[ac1_indices],
+        ac1._ends[ac1_indices],
+        ac2._starts[ac2_indices],
+        ac2._ends[ac2_indices]
+    )
 
+    for an1, match_index in zip(ac1_annotations, best_matches):
         # test if any matching annotations in an2 was found
-        if len(overlapping_annotations) < 1:
+        if match_index < 0:
             missing_an2_annotations += 1
             pair_list.append(
                 (
@@ -252,13 +262,9 @@ def get_annotation_pairs(
                 )
             )
         else:
-            best_matching_annotation = test_max_overlap(
-                silver_annotation=an1,
-                second_annotator_annotations=overlapping_annotations
-            )
             pair_list.append(
-                # pairs first overlapping annotation
-                (an1, best_matching_annotation)
+                # pairs the overlapping annotation with the minimal start and end point difference
+                (an1, ac2_annotations[match_index])
             )
 
     string_difference = np.mean(
@@ -333,6 +339,61 @@ def get_iaa_data(
                 yield an_index, index, an.properties[level.replace('prop:', '')][0]
 
 
+def get_iaa_scores(label_pairs: Counter, distance_function: Callable) -> Tuple[float, float, float]:
+    """Computes Scott's Pi, Cohen's Kappa and Krippendorff's Alpha for two coders.
+    The results equal those of nltk's `AnnotationTask` for the respective (Coder, Item, Label) data,
+    but every distinct label pair gets scored only once.
+
+    Args:
+        label_pairs (Counter): Counts of (first coder label, second coder label) tuples.
+        distance_function (Callable): The distance function, e.g. `nltk.metrics.binary_distance`.
+
+    Raises:
+        ZeroDivisionError: If there are no label pairs or all labels are identical.
+
+    Returns:
+        Tuple[float, float, float]: Scott's Pi, Cohen's Kappa and Krippendorff's Alpha.
+    """
+    # encode the labels as integer codes once, the distance lookup table is built over the distinct labels,
+    # so the distance function is called once per label combination
+    label_values = [label for label_pair in label_pairs for label in label_pair]
+    label_codes, _ = pd.factorize(pd.Series(label_values, dtype=object), use_na_sentinel=False)
+    # the labels are taken from their first occurrence, since factorize replaces None by NaN
+    labels = [label_values[index] for index in np.unique(label_codes, return_index=True)[1]]
+    distances = np.array(
+        [[float(distance_function(label1, label2)) for label2 in labels] for label1 in labels],
+        dtype=np.float64
+    ).reshape(len(labels), len(labels))
+
+    first_labels = label_codes[0::2].astype(np.int64)
+    second_labels = label_codes[1::2].astype(np.int64)
+    counts = np.fromiter(label_pairs.values(), dtype=np.float64, count=len(label_pairs))
+
+    item_count = float(counts.sum())
+    first_label_freqs = np.bincount(first_labels, weights=counts, minlength=len(labels))
+    second_label_freqs = np.bincount(second_labels, weights=counts, minlength=len(labels))
+    label_freqs = first_label_freqs + second_label_freqs
+
+    # python floats, so that degenerate cases raise a ZeroDivisionError like nltk does
+    observed_agreement = float((counts * (1.0 - distances[first_labels, second_labels])).sum()) / item_count
+
+    expected_pi = float((label_freqs ** 2).sum()) / (2 * item_count) ** 2
+    pi = (observed_agreement - expected_pi) / (1 - expected_pi)
+
+    expected_kappa = float((first_label_freqs * second_label_freqs).sum()) / item_count ** 2
+    kappa = (observed_agreement - expected_kappa) / (1.0 - expected_kappa)
+
+    # Krippendorff's disagreement of an item with two labels a, b is (D[a, a] + D[a, b] + D[b, a] + D[b, b]) / 2
+    observed_disagreement = float((counts * (
+        distances[first_labels, first_labels] + distances[first_labels, second_labels]
+        + distances[second_labels, first_labels] + distances[second_labels, second_labels]
+    )).sum()) / (2 * item_count)
+    expected_disagreement = float(label_freqs @ distances @ label_freqs) / ((2 * item_count) * (2 * item_count - 1))
+    alpha = 1.0 - observed_disagreement / expected_disagreement
+
+    return pi, kappa, alpha
+
+
 def gamma_agreement(
         project,
         annotation_collections: List[AnnotationCollection],
@@ -4,7 +4,8 @@ import plotly.graph_objects as go
 from typing import List, Dict
 from dataclasses import dataclass
 from IPython.display import display
-from gitma_canspin.annotation_collection import AnnotationCollection, duplicate_rows
+from gitma_canspin.annotation_collection import AnnotationCollection
+from gitma_canspin._vizualize import duplicate_rows
 
 
 # define CATMA related 
@@ -1,7 +1,7 @@
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Generator
+from typing import Dict, Generator, List
 
 
 def duplicate_generator(df: pd.DataFrame, property_col: str) -> Generator[pd.Series, None, None]:
@@ -248,20 +248,20 @@ def plot_scaled_annotations(ac, tag_scale: dict = None, bin_size: int = 50, smoo
     fig.show()
 
 
-def plot_interactive(catma_project, color_col: str = 'annotation collection') -> go.Figure:
+def plot_interactive(annotation_collections: List, color_col: str = 'annotation collection') -> go.Figure:
     """This function generates one Plotly scatter plot per annotated document in a CATMA project.
     By default the colors represent the annotation collections.
     By that they can't be deactivated with the interactive legend.
 
     Args:
-        catma_project (CatmaProject): The plotted project.
+        annotation_collections (List[AnnotationCollection]): The plotted non-empty annotation collections of a CATMA project.
         color_col (str, optional): 'annotation collection', 'annotator', 'tag' or any property with the prefix 'prop:'. Defaults to 'annotation collection'.
 
     Returns:
         go.Figure: Plotly scatter plot.
     """
     merged_acs = pd.concat(
-        [ac.df for ac in catma_project.annotation_collections if not ac.df.empty]
+        [ac.df for ac in annotation_collections]
     )
     merged_acs.loc[:, 'size'] = merged_acs.end_point - merged_acs.start_point
     merged_acs.loc[:, 'ANNOTATION'] = merged_acs.annotation.apply(
@@ -110,7 +110,7 @@ def write_annotation_json(
         new_annotation_relative_path = new_annotation_relative_path.replace(new_annotation_uuid, uuid_override)
         new_annotation_uuid = uuid_override
 
-    tag_relative_path = tag.path[tag.path.index('/')+1:tag.path.rindex('/')]
+    tag_relative_path = os.path.relpath(os.path.dirname(tag.path), project.project_root).replace('\\', '/')
 
     context_dict = {
         Tag.SYSTEM_PROPERTY_UUID_CATMA_MARKUPTIMESTAMP: f'{tag_relative_path}/{Tag.SYSTEM_PROPERTY_UUID_CATMA_MARKUPTIMESTAMP}',
@@ -236,7 +236,7 @@ def write_annotation_json_with_ac_object(
         new_annotation_relative_path = new_annotation_relative_path.replace(new_annotation_uuid, uuid_override)
         new_annotation_uuid = uuid_override
 
-    tag_relative_path = tag.path[tag.path.index('/')+1:tag.path.rindex('/')]
+    tag_relative_path = os.path.relpath(os.path.dirname(tag.path), project.project_root).replace('\\', '/')
 
     context_dict = {
         Tag.SYSTEM_PROPERTY_UUID_CATMA_MARKUPTIMESTAMP: f'{tag_relative_path}/{Tag.SYSTEM_PROPERTY_UUID_CATMA_MARKUPTIMESTAMP}',
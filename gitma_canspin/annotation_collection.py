@@ -3,14 +3,13 @@ import os
 import string
 import subprocess
 import re
+import numpy as np
 import pandas as pd
 from typing import List, Union, Dict, Tuple
 from collections import Counter
 from gitma_canspin.text import Text
 from gitma_canspin.annotation import Annotation
 from gitma_canspin.tag import Tag
-from gitma_canspin._export_annotations import to_stanford_tsv, create_basic_token_tsv, create_annotated_token_tsv, create_annotated_tei
-from gitma_canspin._vizualize import plot_annotations, plot_scaled_annotations, duplicate_rows
 
 
 def split_property_dict_to_column(ac_df):
@@ -84,10 +83,10 @@ def clean_text_in_ac_df(annotation: str) -> str:
 
 
 def load_annotations(catma_project, ac, context: int):
-    base_dir = f'{os.getcwd()}/{catma_project.uuid}/collections/{ac.uuid}/annotations/'
+    base_dir = os.path.join(catma_project.project_root, 'collections', ac.uuid, 'annotations')
     # load all annotation collection page files
     for filename in os.listdir(base_dir):
-        page_file_path = base_dir + filename
+        page_file_path = os.path.join(base_dir, filename)
         with open(page_file_path, 'r', encoding='utf-8', newline='') as page_file:
             # load all annotations
             page_file_annotations = json.load(page_file)
@@ -144,6 +143,11 @@ class AnnotationCollection:
     Raises:
         FileNotFoundError: If the path of the annotation collection's header.json does not exist.
     """
+    __slots__ = (
+        'uuid', 'projects_directory', 'project_uuid', 'directory', 'header', 'name',
+        'plain_text_id', 'text', 'text_version', 'annotations', 'tags', 'df',
+        '_starts', '_ends', '_tags'
+    )
 
     def __init__(self, ac_uuid: str, catma_project, context: int = 50):
         #: The annotation collection's UUID.
@@ -158,8 +162,11 @@ class AnnotationCollection:
         #: The annotation collection's directory.
         self.directory: str = f'{catma_project.uuid}/collections/{self.uuid}/'
 
+        # the annotation collection's files are accessed by absolute paths, so loading does not depend on the working directory
+        absolute_directory = os.path.join(catma_project.project_root, 'collections', self.uuid)
+
         try:
-            with open(self.directory + 'header.json', 'r', encoding='utf-8', newline='') as header_json:
+            with open(os.path.join(absolute_directory, 'header.json'), 'r', encoding='utf-8', newline='') as header_json:
                 self.header: str = json.load(header_json)
         except FileNotFoundError:
             raise FileNotFoundError(
@@ -174,14 +181,14 @@ class AnnotationCollection:
 
         #: The document of the annotation collection as a gitma_canspin.Text object.
         self.text: Text = Text(
-            project_uuid=catma_project.uuid,
+            project_uuid=catma_project.project_root,
             document_uuid=self.plain_text_id
         )
 
         #: The document's version.
         self.text_version: str = self.header.get('sourceDocumentVersion')
 
-        if os.path.isdir(self.directory + 'annotations/'):
+        if os.path.isdir(os.path.join(absolute_directory, 'annotations')):
             #: List of annotations in annotation collection as gitma_canspin.Annotation objects.
             self.annotations: List[Annotation] = sorted(list(load_annotations(
                 catma_project=catma_project,
@@ -212,6 +219,29 @@ class AnnotationCollection:
         for an in self.annotations:
             yield an
 
+    def _cache_arrays(self) -> None:
+        """Stores the start points, end points and tag names of the annotations as numpy arrays,
+        if they have not been stored yet. The arrays follow the order of `self.annotations`.
+        """
+        if not hasattr(self, '_starts'):
+            self._starts: np.ndarray = np.fromiter(
+                (an.start_point for an in self.annotations), dtype=np.int64, count=len(self.annotations))
+            self._ends: np.ndarray = np.fromiter(
+                (an.end_point for an in self.annotations), dtype=np.int64, count=len(self.annotations))
+            self._tags: pd.Categorical = pd.Categorical([an.tag.name for an in self.annotations])
+
+    def _tag_indices(self, tags: list) -> np.ndarray:
+        """Returns the positions of all annotations in `self.annotations` with a tag in the given list.
+
+        Args:
+            tags (list): The list of tag names.
+
+        Returns:
+            np.ndarray: The positions of the matching annotations.
+        """
+        self._cache_arrays()
+        return np.flatnonzero(self._tags.isin(list(tags)))
+
     def to_list(self, tags: Union[list, None] = None) -> List[dict]:
         """Returns list of annotations as dictionaries using the `Annotation.to_dict()` method.
 
@@ -250,6 +280,7 @@ class AnnotationCollection:
         Returns:
             pd.DataFrame: A duplicate of the annotation collection's DataFrame.
         """
+        from gitma_canspin._vizualize import duplicate_rows
         try:
             return duplicate_rows(ac_df=self.df, property_col=prop)
         except KeyError:
@@ -285,6 +316,7 @@ class AnnotationCollection:
         Returns:
             go.Figure: Plotly scatter plot.
         """
+        from gitma_canspin._vizualize import plot_annotations
         return plot_annotations(ac=self, y_axis=y_axis, color_prop=color_prop)
 
     def filter_by_tag_path(self, path_element: str) -> pd.DataFrame:
@@ -314,6 +346,7 @@ class AnnotationCollection:
         Raises:
             Exception: _description_
         """
+        from gitma_canspin._vizualize import plot_scaled_annotations
         return plot_scaled_annotations(ac=self, tag_scale=tag_scale, bin_size=bin_size, smoothing_window=smoothing_window)
 
     def cooccurrence_network(
@@ -377,6 +410,7 @@ class AnnotationCollection:
         Returns:
             pd.DataFrame: The data as pandas DataFrame.
         """
+        from gitma_canspin._vizualize import duplicate_rows
 
         if 'prop:' in tag_col:
             analyze_df = duplicate_rows(self.df, property_col=tag_col)
@@ -407,6 +441,7 @@ class AnnotationCollection:
         Returns:
             pd.DataFrame: DataFrame with properties as index and property values as header.
         """
+        from gitma_canspin._vizualize import duplicate_rows
         return pd.DataFrame(
             {col: duplicate_rows(self.df, col)[col].value_counts(
             ) for col in self.df.columns if 'prop:' in col}
@@ -478,6 +513,7 @@ class AnnotationCollection:
         """
         if tags == 'all':
             tags = list(self.df['tag'].unique())
+        from gitma_canspin._export_annotations import to_stanford_tsv
         to_stanford_tsv(ac=self, tags=tags, file_name=file_name, spacy_model_lang=spacy_model_lang)
 
     def create_basic_token_tsv(
@@ -494,6 +530,7 @@ class AnnotationCollection:
             text_borders (tuple, optional): cut off delivered text by begin and end value of text string.
             nlp_max_text_len (int, optional): specifies spacys accepted max text length for tokenization.
         """
+        from gitma_canspin._export_annotations import create_basic_token_tsv
         create_basic_token_tsv(ac=self, created_file_name=created_file_name, spacy_model_lang=spacy_model_lang, text_borders=text_borders, nlp_max_text_len=nlp_max_text_len)
     
     def create_annotated_token_tsv(
@@ -510,6 +547,7 @@ class AnnotationCollection:
             text_borders (tuple, optional): cut off delivered text by begin and end value of text string. It must have the same value as it had when creating the delivered basic token tsv file.
             use_all_text_selection_segments (bool, optional): the parameter sets the processing mode for text selection segments. There are two processing modes: Consider all text selection segments of an annotation for the export (True: used for short, discontinuous annotations) or consider only the start and end point of an annotation and treat this as a single text selection segment, even if several segments are present in the data (False: used for longer, contiguous annotations). This mode distinction is necessary because CATMA divides longer, contiguous annotations internally into several text selection segments and this division should not be passed on to the exported data.
         """
+        from gitma_canspin._export_annotations import create_annotated_token_tsv
         create_annotated_token_tsv(ac=self, basic_token_file_name=basic_token_file_name, created_file_name=created_file_name, text_borders=text_borders, use_all_text_selection_segments=use_all_text_selection_segments)
 
     def create_annotated_tei(
@@ -526,6 +564,7 @@ class AnnotationCollection:
             insert_paragraphs (bool): controls if file text is put directly into body element or in childen-p elements, if paragraphs were delivered originally when the text was imported into CATMA. Defaults to True.
             paragraph_recognition_text_class (str): selects a condition against which token are checked against in xml creation process to decide where a new paragraph begins. Defaults to 'eltec-deu'.
         """
+        from gitma_canspin._export_annotations import create_annotated_tei
         create_annotated_tei(annotated_token_file_name=annotated_token_file_name, created_file_name=created_file_name, insert_paragraphs=insert_paragraphs, paragraph_recognition_text_class=paragraph_recognition_text_class)
 
     def write_annotation_csv(
@@ -6,6 +6,8 @@ from gitma_canspin._helper import (
     dict_travel_generator, 
     reduce_decimal_place, 
     prevent_division_by_zero,
+    sum_class_counts,
+    sum_word_lists,
     translate_dict, 
     abs_local_save_path, 
     canspin_catma_projects, 
@@ -22,13 +24,14 @@ import subprocess
 import random
 import yaml
 import json
-import re
 
 from typing import Union, Tuple, Dict, List, Generator
 
 import plotly.graph_objects
 import pygal
 from collections import Counter
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
 import plotly.express as px
 import plotly
 import numpy as np
@@ -58,7 +61,8 @@ class CanspinProject:
             'project_name': 'CATMA_4AA4ADC0-4C28-54F9-B6A1-5DCEFF34B90B_DH2025_CANSpiN',
             'selected_annotation_collection': None,
             'load_from_gitlab': False,
-            'gitlab_access_token': None
+            'gitlab_access_token': None,
+            'use_local_mirror': False
         }
 
         self.init_settings: dict = self.default_init_settings if not init_settings else init_settings
@@ -66,7 +70,17 @@ class CanspinProject:
         self.project: Union[CatmaProject, None] = imported_project if imported_project else self.load_project()
         self.unify_plain_text_line_endings()
 
-        self.tsv_annotations: Dict[str, Dict[str, pd.DataFrame]] = self.load_tsv_annotations()
+        # the corpora folders with the annotation tsv files are searched in the working directory at initialization, see tsv_annotations
+        self.tsv_annotations_directory: str = os.getcwd()
+
+    @cached_property
+    def tsv_annotations(self) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """Annotation data loaded by load_tsv_annotations on first access and cached afterwards.
+
+        Returns:
+            Dict[str, Dict[str, pd.DataFrame]]: Dict of annotation schemas with dicts of tsv filenames and the respective annotation dataframes.
+        """
+        return self.load_tsv_annotations()
 
     def load_project(self) -> Union[CatmaProject, None]:
         """Method to fill self.project with a CatmaProject instance downloaded from Catmas gitlab or from local folder.
@@ -79,7 +93,8 @@ class CanspinProject:
                 project_name=self.init_settings.get('project_name', 'CATMA_4AA4ADC0-4C28-54F9-B6A1-5DCEFF34B90B_DH2025_CANSpiN'),
                 included_acs=self.init_settings.get('selected_annotation_collection'),
                 load_from_gitlab=self.init_settings.get('load_from_gitlab', False),
-                gitlab_access_token=self.init_settings.get('gitlab_access_token')
+                gitlab_access_token=self.init_settings.get('gitlab_access_token'),
+                use_local_mirror=self.init_settings.get('use_local_mirror', False)
             )
         except:
             logger.warning('Could not load the Catma project.', exc_info=True)
@@ -117,6 +132,9 @@ class CanspinProject:
         except:
             logger.warning('Could not update the Catma project.', exc_info=True)
 
+        # reload the tsv annotations on next access
+        self.__dict__.pop('tsv_annotations', None)
+
     def load_tsv_annotations(self) -> Dict[str, Dict[str, pd.DataFrame]]:
         """Method to fill self.tsv_annotations with a dict of dicts containing a tsv filename as key and a Dataframe with the respective annotation data as value.
         The Data is derived from the tsv folders within the CANSpiN corpora repos. For that, the corpus.yaml inside the repos is processed as well as the respective tsv folders.
@@ -128,7 +146,7 @@ class CanspinProject:
             Dict[str, Dict[str, pd.DataFrame]] or an empty dict: A dict with a dict of lists of Dataframes derived from the annotation tsv files or an empty dict in case of missing tsv files or repo folders.
         """
         # get corpus repos in project folder, using hardcoded dict canspin_catma_projects from helper module
-        rel_local_save_path = os.getcwd()
+        rel_local_save_path = self.tsv_annotations_directory
         folders_in_project_folder: List[str] = os.listdir(rel_local_save_path)
         projects_corpora_folders_in_project_folder: List[str] = [folder for folder in folders_in_project_folder if self.init_settings['project_name'] in canspin_catma_projects and folder in canspin_catma_projects[self.init_settings['project_name']]['corpora_folders']]
 
@@ -341,8 +359,18 @@ class CanspinProject:
         if not substrings:
             raise ValueError('No valid substring input has been provided.')
         
-        occurences_start = [match.start() for match in re.finditer(substrings[0], self.project.annotation_collections[annotation_collection_index].text.plain_text)]
-        occurences_end = [match.end() for match in re.finditer(substrings[1], self.project.annotation_collections[annotation_collection_index].text.plain_text)]
+        def _find_all(text: str, substring: str) -> List[int]:
+            # literal, non-overlapping search with str.find, which scans the text in C without compiling a regular expression
+            occurences: List[int] = []
+            index: int = text.find(substring)
+            while index != -1:
+                occurences.append(index)
+                index = text.find(substring, index + max(len(substring), 1))
+            return occurences
+
+        plain_text: str = self.project.annotation_collections[annotation_collection_index].text.plain_text
+        occurences_start = _find_all(plain_text, substrings[0])
+        occurences_end = [index + len(substrings[1]) for index in _find_all(plain_text, substrings[1])]
         
         result = (occurences_start[0], occurences_end[0]) \
                  if len(occurences_start) == 1 and len(occurences_end) == 1 \
@@ -735,8 +763,6 @@ class AnnotationAnalyzer(CanspinProject):
             ValueError: Is raised if tsv_filepath_list is empty, contains other data types than strings, if delivered data do not follow the CANSpiN annotation file schema or if not all annotations belong to the class system specified in the render_settings.
             FileNotFoundError: Is raised if a given filepath is wrong.
         """
-        dataframes: List[Dict[str, pd.DataFrame]] = []
-
         # initial input checks
         if not len(tsv_filepath_list):
             raise ValueError('Input data is neither a dataframe nor a list of strings.')
@@ -747,9 +773,23 @@ class AnnotationAnalyzer(CanspinProject):
             if not os.path.exists(tsv_filepath):
                 raise FileNotFoundError('A filepath given in the input data is not valid.')
             
+        # tags with iob prefixes allowed by the selected class system, tags outside of it are read as missing values
+        class_system_tags: List[str] = ['O'] + [
+            f'{prefix}-{classname}' for classname in self.category_and_class_systems[render_settings['category_and_class_system_name']]['classes']
+            for prefix in ('B', 'I')
+        ]
+        tag_dtype: pd.CategoricalDtype = pd.CategoricalDtype(categories=class_system_tags, ordered=False)
+
         # transformation into dataframes and data structure checks
-        for tsv_filepath in tsv_filepath_list:
-            df: pd.DataFrame = pd.read_csv(tsv_filepath, sep='\t')
+        def _read_tsv_file(tsv_filepath: str) -> pd.DataFrame:
+            df: pd.DataFrame = pd.read_csv(
+                tsv_filepath,
+                sep='\t',
+                usecols=lambda column_name: column_name in canspin_annotation_tsv_columns,
+                dtype={'Tag': tag_dtype},
+                engine='c',
+                low_memory=False
+            )
 
             missing_columns: bool = bool(len([column_name for column_name in canspin_annotation_tsv_columns if column_name not in df.columns]))
             missing_data: bool = bool(not len(df.index))
@@ -758,18 +798,23 @@ class AnnotationAnalyzer(CanspinProject):
             if missing_data:
                 raise ValueError('The tsv file does not contain any data besides the column names.')
             
-            df_without_iob_prefixes_on_tags: pd.DataFrame = df['Tag'].apply(lambda x: x[2:] if x != 'O' else 'O')
-            all_tags: np.ndarray = df_without_iob_prefixes_on_tags.unique()
-            canspin_tags: np.ndarray = all_tags[all_tags != 'O']
-            out_of_schema_tags: bool = bool([tag for tag in canspin_tags if tag not in self.category_and_class_systems[render_settings['category_and_class_system_name']]['classes']])
+            out_of_schema_tags: bool = bool(df['Tag'].isna().any())
             if out_of_schema_tags:
                 raise ValueError('The tsv file does contain tags which does not belong to the class system selected in the render settings.')
+            # analyzing methods process the tags as strings
+            df['Tag'] = df['Tag'].astype(object)
+
+            return df
 
-            dataframes.append({tsv_filepath: df})
+        if len(tsv_filepath_list) == 1:
+            return _read_tsv_file(tsv_filepath_list[0])
 
-        # concatinate dataframes, if needed, and return the result dataframe
-        return dataframes[0][list(dataframes[0].keys())[0]] if len(dataframes) == 1 else \
-                pd.concat([element[list(element.keys())[0]] for element in dataframes]).reset_index(drop=True)
+        # read_csv releases the GIL while parsing, so multiple files are read in parallel threads
+        with ThreadPoolExecutor(max_workers=min(8, len(tsv_filepath_list))) as executor:
+            dataframes: List[pd.DataFrame] = list(executor.map(_read_tsv_file, tsv_filepath_list))
+
+        # concatinate dataframes in order of the given list and return the result dataframe
+        return pd.concat(dataframes, ignore_index=True, copy=False)
 
     def test_text_borders(
             self, 
@@ -1147,8 +1192,9 @@ class AnnotationAnalyzer(CanspinProject):
 
             # Extract chapter heads from the XML file
             def extract_head_from_chapters(xml_file: str) -> List[str]:
-                with open(xml_file, 'r', encoding='utf-8') as file:
-                    xml_content: str = file.read()
+                # the raw bytes are passed to the parser, which decodes them according to the xml declaration
+                with open(xml_file, 'rb') as file:
+                    xml_content: bytes = file.read()
 
                 # Parse the XML content
                 parsed_xml_text: bs4.BeautifulSoup = bs4.BeautifulSoup(xml_content, 'xml')
@@ -1451,43 +1497,32 @@ class AnnotationAnalyzer(CanspinProject):
                             result['amount_of_annotations_by_class'][file_tuple[0]][file_tuple_group[0]][file_tuple_group[1]][file_tuple[1]] = file_summary
 
                 # calculate sums by groups and possible subgroups
-                # TODO: transform into dict comprehensions
                 for schema, grouping in group_list:
                     if len(grouping) == 1:
-                        sum_dict_by_group = {}
-                        for filename in result['amount_of_annotations_by_class'][schema][grouping[0]]:
-                            for classname in result['amount_of_annotations_by_class'][schema][grouping[0]][filename]:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = 0
-                                sum_dict_by_group[classname] += result['amount_of_annotations_by_class'][schema][grouping[0]][filename][classname]
+                        sum_dict_by_group = sum_class_counts(
+                            result['amount_of_annotations_by_class'][schema][grouping[0]][filename]
+                            for filename in result['amount_of_annotations_by_class'][schema][grouping[0]]
+                        )
                         result['amount_of_annotations_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
                     elif len(grouping) == 2:
-                        sum_dict_by_subgroup = {}
-                        for filename in result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]]:
-                            for classname in result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]][filename]:
-                                if classname not in sum_dict_by_subgroup:
-                                    sum_dict_by_subgroup[classname] = 0
-                                sum_dict_by_subgroup[classname] += result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]][filename][classname]
+                        sum_dict_by_subgroup = sum_class_counts(
+                            result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]][filename]
+                            for filename in result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]]
+                        )
                         result['amount_of_annotations_by_class'][schema][grouping[0]][grouping[1]]['TOTAL'] = sum_dict_by_subgroup
-                        sum_dict_by_group = {}
-                        for subgroup in result['amount_of_annotations_by_class'][schema][grouping[0]]:
-                            if subgroup == 'TOTAL' or 'TOTAL' not in result['amount_of_annotations_by_class'][schema][grouping[0]][subgroup]:
-                                continue
-                            for classname in result['amount_of_annotations_by_class'][schema][grouping[0]][subgroup]['TOTAL']:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = 0
-                                sum_dict_by_group[classname] += result['amount_of_annotations_by_class'][schema][grouping[0]][subgroup]['TOTAL'][classname]
+                        sum_dict_by_group = sum_class_counts(
+                            result['amount_of_annotations_by_class'][schema][grouping[0]][subgroup]['TOTAL']
+                            for subgroup in result['amount_of_annotations_by_class'][schema][grouping[0]]
+                            if subgroup != 'TOTAL' and 'TOTAL' in result['amount_of_annotations_by_class'][schema][grouping[0]][subgroup]
+                        )
                         result['amount_of_annotations_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['amount_of_annotations_by_class']:
-                    sum_dict_by_schema = {}
-                    for group in result['amount_of_annotations_by_class'][schema]:
-                        for classname in result['amount_of_annotations_by_class'][schema][group]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = 0
-                            sum_dict_by_schema[classname] += result['amount_of_annotations_by_class'][schema][group]['TOTAL'][classname]
+                    sum_dict_by_schema = sum_class_counts(
+                        result['amount_of_annotations_by_class'][schema][group]['TOTAL']
+                        for group in result['amount_of_annotations_by_class'][schema]
+                    )
                     result['amount_of_annotations_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             # execute amount of annotations by class calculation with default groups by annotation schema and corpus
@@ -1543,25 +1578,19 @@ class AnnotationAnalyzer(CanspinProject):
                     result['amount_of_annotations_by_class'][schema][corpus][filename] = file_summary
 
                 # calculate sums by corpus
-                # TODO: transform into dict comprehension
                 for schema, corpus in corpus_list:
-                    sum_dict_by_corpus = {}
-                    for filename in result['amount_of_annotations_by_class'][schema][corpus]:
-                        for classname in result['amount_of_annotations_by_class'][schema][corpus][filename]:
-                            if classname not in sum_dict_by_corpus:
-                                sum_dict_by_corpus[classname] = 0
-                            sum_dict_by_corpus[classname] += result['amount_of_annotations_by_class'][schema][corpus][filename][classname]
+                    sum_dict_by_corpus = sum_class_counts(
+                        result['amount_of_annotations_by_class'][schema][corpus][filename]
+                        for filename in result['amount_of_annotations_by_class'][schema][corpus]
+                    )
                     result['amount_of_annotations_by_class'][schema][corpus]['TOTAL'] = sum_dict_by_corpus
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['amount_of_annotations_by_class']:
-                    sum_dict_by_schema = {}
-                    for corpus in result['amount_of_annotations_by_class'][schema]:
-                        for classname in result['amount_of_annotations_by_class'][schema][corpus]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = 0
-                            sum_dict_by_schema[classname] += result['amount_of_annotations_by_class'][schema][corpus]['TOTAL'][classname]
+                    sum_dict_by_schema = sum_class_counts(
+                        result['amount_of_annotations_by_class'][schema][corpus]['TOTAL']
+                        for corpus in result['amount_of_annotations_by_class'][schema]
+                    )
                     result['amount_of_annotations_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             return result
@@ -1879,43 +1908,32 @@ class AnnotationAnalyzer(CanspinProject):
                             result['amount_of_annotated_token_by_class'][file_tuple[0]][file_tuple_group[0]][file_tuple_group[1]][file_tuple[1]] = file_summary
 
                 # calculate sums by groups and possible subgroups
-                # TODO: transform into dict comprehensions
                 for schema, grouping in group_list:
                     if len(grouping) == 1:
-                        sum_dict_by_group = {}
-                        for filename in result['amount_of_annotated_token_by_class'][schema][grouping[0]]:
-                            for classname in result['amount_of_annotated_token_by_class'][schema][grouping[0]][filename]:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = 0
-                                sum_dict_by_group[classname] += result['amount_of_annotated_token_by_class'][schema][grouping[0]][filename][classname]
+                        sum_dict_by_group = sum_class_counts(
+                            result['amount_of_annotated_token_by_class'][schema][grouping[0]][filename]
+                            for filename in result['amount_of_annotated_token_by_class'][schema][grouping[0]]
+                        )
                         result['amount_of_annotated_token_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
                     if len(grouping) == 2:
-                        sum_dict_by_subgroup = {}
-                        for filename in result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]]:
-                            for classname in result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]][filename]:
-                                if classname not in sum_dict_by_subgroup:
-                                    sum_dict_by_subgroup[classname] = 0
-                                sum_dict_by_subgroup[classname] += result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]][filename][classname]
+                        sum_dict_by_subgroup = sum_class_counts(
+                            result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]][filename]
+                            for filename in result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]]
+                        )
                         result['amount_of_annotated_token_by_class'][schema][grouping[0]][grouping[1]]['TOTAL'] = sum_dict_by_subgroup
-                        sum_dict_by_group = {}
-                        for subgroup in result['amount_of_annotated_token_by_class'][schema][grouping[0]]:
-                            if subgroup == 'TOTAL' or 'TOTAL' not in result['amount_of_annotated_token_by_class'][schema][grouping[0]][subgroup]:
-                                continue
-                            for classname in result['amount_of_annotated_token_by_class'][schema][grouping[0]][subgroup]['TOTAL']:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = 0
-                                sum_dict_by_group[classname] += result['amount_of_annotated_token_by_class'][schema][grouping[0]][subgroup]['TOTAL'][classname]
+                        sum_dict_by_group = sum_class_counts(
+                            result['amount_of_annotated_token_by_class'][schema][grouping[0]][subgroup]['TOTAL']
+                            for subgroup in result['amount_of_annotated_token_by_class'][schema][grouping[0]]
+                            if subgroup != 'TOTAL' and 'TOTAL' in result['amount_of_annotated_token_by_class'][schema][grouping[0]][subgroup]
+                        )
                         result['amount_of_annotated_token_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['amount_of_annotated_token_by_class']:
-                    sum_dict_by_schema = {}
-                    for group in result['amount_of_annotated_token_by_class'][schema]:
-                        for classname in result['amount_of_annotated_token_by_class'][schema][group]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = 0
-                            sum_dict_by_schema[classname] += result['amount_of_annotated_token_by_class'][schema][group]['TOTAL'][classname]
+                    sum_dict_by_schema = sum_class_counts(
+                        result['amount_of_annotated_token_by_class'][schema][group]['TOTAL']
+                        for group in result['amount_of_annotated_token_by_class'][schema]
+                    )
                     result['amount_of_annotated_token_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             # execute amount of annotated token by class calculation with default groups per annotation schema and corpus
@@ -1972,25 +1990,19 @@ class AnnotationAnalyzer(CanspinProject):
                     result['amount_of_annotated_token_by_class'][schema][corpus][filename] = file_summary
 
                 # calculate sums by corpus
-                # TODO: transform into dict comprehension
                 for schema, corpus in corpus_list:
-                    sum_dict_by_corpus = {}
-                    for filename in result['amount_of_annotated_token_by_class'][schema][corpus]:
-                        for classname in result['amount_of_annotated_token_by_class'][schema][corpus][filename]:
-                            if classname not in sum_dict_by_corpus:
-                                sum_dict_by_corpus[classname] = 0
-                            sum_dict_by_corpus[classname] += result['amount_of_annotated_token_by_class'][schema][corpus][filename][classname]
+                    sum_dict_by_corpus = sum_class_counts(
+                        result['amount_of_annotated_token_by_class'][schema][corpus][filename]
+                        for filename in result['amount_of_annotated_token_by_class'][schema][corpus]
+                    )
                     result['amount_of_annotated_token_by_class'][schema][corpus]['TOTAL'] = sum_dict_by_corpus
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['amount_of_annotated_token_by_class']:
-                    sum_dict_by_schema = {}
-                    for corpus in result['amount_of_annotated_token_by_class'][schema]:
-                        for classname in result['amount_of_annotated_token_by_class'][schema][corpus]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = 0
-                            sum_dict_by_schema[classname] += result['amount_of_annotated_token_by_class'][schema][corpus]['TOTAL'][classname]
+                    sum_dict_by_schema = sum_class_counts(
+                        result['amount_of_annotated_token_by_class'][schema][corpus]['TOTAL']
+                        for corpus in result['amount_of_annotated_token_by_class'][schema]
+                    )
                     result['amount_of_annotated_token_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             return result
@@ -2398,71 +2410,32 @@ class AnnotationAnalyzer(CanspinProject):
                             result['word_lists_by_class'][file_tuple[0]][file_tuple_group[0]][file_tuple_group[1]][file_tuple[1]] = file_summary
 
                 # calculate sums by groups and possible subgroups
-                # TODO: transform into dict comprehensions
                 for schema, grouping in group_list:
                     if len(grouping) == 1:
-                        sum_dict_by_group = {}
-                        for filename in result['word_lists_by_class'][schema][grouping[0]]:
-                            for classname in result['word_lists_by_class'][schema][grouping[0]][filename]:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = {}
-                                for token in result['word_lists_by_class'][schema][grouping[0]][filename][classname]:
-                                    if token in sum_dict_by_group[classname]:
-                                        sum_dict_by_group[classname][token] = sum_dict_by_group[classname][token] + \
-                                                                              result['word_lists_by_class'][schema][grouping[0]][filename][classname][token]
-                                        continue
-                                    sum_dict_by_group[classname][token] = result['word_lists_by_class'][schema][grouping[0]][filename][classname][token]
-                        for classname in sum_dict_by_group:
-                            sum_dict_by_group[classname] = dict(sorted(sum_dict_by_group[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                        sum_dict_by_group = sum_word_lists(
+                            result['word_lists_by_class'][schema][grouping[0]][filename]
+                            for filename in result['word_lists_by_class'][schema][grouping[0]]
+                        )
                         result['word_lists_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
                     if len(grouping) == 2:
-                        sum_dict_by_subgroup = {}
-                        for filename in result['word_lists_by_class'][schema][grouping[0]][grouping[1]]:
-                            for classname in result['word_lists_by_class'][schema][grouping[0]][grouping[1]][filename]:
-                                if classname not in sum_dict_by_subgroup:
-                                    sum_dict_by_subgroup[classname] = {}
-                                for token in result['word_lists_by_class'][schema][grouping[0]][grouping[1]][filename][classname]:
-                                    if token in sum_dict_by_subgroup[classname]:
-                                        sum_dict_by_subgroup[classname][token] = sum_dict_by_subgroup[classname][token] + \
-                                                                                 result['word_lists_by_class'][schema][grouping[0]][grouping[1]][filename][classname][token]
-                                        continue
-                                    sum_dict_by_subgroup[classname][token] = result['word_lists_by_class'][schema][grouping[0]][grouping[1]][filename][classname][token]
-                        for classname in sum_dict_by_subgroup:
-                            sum_dict_by_subgroup[classname] = dict(sorted(sum_dict_by_subgroup[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                        sum_dict_by_subgroup = sum_word_lists(
+                            result['word_lists_by_class'][schema][grouping[0]][grouping[1]][filename]
+                            for filename in result['word_lists_by_class'][schema][grouping[0]][grouping[1]]
+                        )
                         result['word_lists_by_class'][schema][grouping[0]][grouping[1]]['TOTAL'] = sum_dict_by_subgroup
-                        sum_dict_by_group = {}
-                        for subgroup in result['word_lists_by_class'][schema][grouping[0]]:
-                            if subgroup == 'TOTAL' or 'TOTAL' not in result['word_lists_by_class'][schema][grouping[0]][subgroup]:
-                                continue
-                            for classname in result['word_lists_by_class'][schema][grouping[0]][subgroup]['TOTAL']:
-                                if classname not in sum_dict_by_group:
-                                    sum_dict_by_group[classname] = {}
-                                for token in result['word_lists_by_class'][schema][grouping[0]][subgroup]['TOTAL'][classname]:
-                                    if token in sum_dict_by_group[classname]:
-                                        sum_dict_by_group[classname][token] = sum_dict_by_group[classname][token] + \
-                                                                              result['word_lists_by_class'][schema][grouping[0]][subgroup]['TOTAL'][classname][token]
-                                        continue
-                                    sum_dict_by_group[classname][token] = result['word_lists_by_class'][schema][grouping[0]][subgroup]['TOTAL'][classname][token]
-                        for classname in sum_dict_by_group:
-                            sum_dict_by_group[classname] = dict(sorted(sum_dict_by_group[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                        sum_dict_by_group = sum_word_lists(
+                            result['word_lists_by_class'][schema][grouping[0]][subgroup]['TOTAL']
+                            for subgroup in result['word_lists_by_class'][schema][grouping[0]]
+                            if subgroup != 'TOTAL' and 'TOTAL' in result['word_lists_by_class'][schema][grouping[0]][subgroup]
+                        )
                         result['word_lists_by_class'][schema][grouping[0]]['TOTAL'] = sum_dict_by_group
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['word_lists_by_class']:
-                    sum_dict_by_schema = {}
-                    for group in result['word_lists_by_class'][schema]:
-                        for classname in result['word_lists_by_class'][schema][group]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = {}
-                            for token in result['word_lists_by_class'][schema][group]['TOTAL'][classname]:
-                                if token in sum_dict_by_schema[classname]:
-                                    sum_dict_by_schema[classname][token] = sum_dict_by_schema[classname][token] + \
-                                                                           result['word_lists_by_class'][schema][group]['TOTAL'][classname][token]
-                                    continue
-                                sum_dict_by_schema[classname][token] = result['word_lists_by_class'][schema][group]['TOTAL'][classname][token]
-                    for classname in sum_dict_by_schema:
-                        sum_dict_by_schema[classname] = dict(sorted(sum_dict_by_schema[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                    sum_dict_by_schema = sum_word_lists(
+                        result['word_lists_by_class'][schema][group]['TOTAL']
+                        for group in result['word_lists_by_class'][schema]
+                    )
                     result['word_lists_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             # execute word_lists_by_class calculation with default groups by annotation schema and corpus
@@ -2521,39 +2494,19 @@ class AnnotationAnalyzer(CanspinProject):
                     result['word_lists_by_class'][schema][corpus][filename] = file_summary
 
                 # calculate sums by corpus
-                # TODO: transform into dict comprehension
                 for schema, corpus in corpus_list:
-                    sum_dict_by_corpus = {}
-                    for filename in result['word_lists_by_class'][schema][corpus]:
-                        for classname in result['word_lists_by_class'][schema][corpus][filename]:
-                            if classname not in sum_dict_by_corpus:
-                                sum_dict_by_corpus[classname] = {}                            
-                            for token in result['word_lists_by_class'][schema][corpus][filename][classname]:
-                                if token in sum_dict_by_corpus[classname]:
-                                    sum_dict_by_corpus[classname][token] = sum_dict_by_corpus[classname][token] + \
-                                                                           result['word_lists_by_class'][schema][corpus][filename][classname][token]
-                                    continue
-                                sum_dict_by_corpus[classname][token] = result['word_lists_by_class'][schema][corpus][filename][classname][token]
-                    for classname in sum_dict_by_corpus:
-                        sum_dict_by_corpus[classname] = dict(sorted(sum_dict_by_corpus[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                    sum_dict_by_corpus = sum_word_lists(
+                        result['word_lists_by_class'][schema][corpus][filename]
+                        for filename in result['word_lists_by_class'][schema][corpus]
+                    )
                     result['word_lists_by_class'][schema][corpus]['TOTAL'] = sum_dict_by_corpus
 
                 # calculate sums by schema
-                # TODO: transform into dict comprehension
                 for schema in result['word_lists_by_class']:
-                    sum_dict_by_schema = {}
-                    for corpus in result['word_lists_by_class'][schema]:
-                        for classname in result['word_lists_by_class'][schema][corpus]['TOTAL']:
-                            if classname not in sum_dict_by_schema:
-                                sum_dict_by_schema[classname] = {}
-                            for token in result['word_lists_by_class'][schema][corpus]['TOTAL'][classname]:
-                                if token in sum_dict_by_schema[classname]:
-                                    sum_dict_by_schema[classname][token] = sum_dict_by_schema[classname][token] + \
-                                                                           result['word_lists_by_class'][schema][corpus]['TOTAL'][classname][token]
-                                    continue
-                                sum_dict_by_schema[classname][token] = result['word_lists_by_class'][schema][corpus]['TOTAL'][classname][token]
-                    for classname in sum_dict_by_schema:
-                        sum_dict_by_schema[classname] = dict(sorted(sum_dict_by_schema[classname].items(), key=lambda x: int(x[1]), reverse=True))
+                    sum_dict_by_schema = sum_word_lists(
+                        result['word_lists_by_class'][schema][corpus]['TOTAL']
+                        for corpus in result['word_lists_by_class'][schema]
+                    )
                     result['word_lists_by_class'][schema]['TOTAL'] = sum_dict_by_schema
 
             return result
@@ -1,12 +1,12 @@
 import subprocess
 import os
 import json
-import textwrap
+import base64
+import shutil
+from collections import Counter
 import gitlab
 import pygit2
-import pandas as pd
-import plotly.graph_objects as go
-from typing import Dict, List, Tuple, Union, Generator
+from typing import Dict, List, Tuple, Union, Generator, TYPE_CHECKING
 from gitma_canspin.text import Text
 from gitma_canspin.tagset import Tagset
 from gitma_canspin.annotation_collection import AnnotationCollection
@@ -14,22 +14,133 @@ from gitma_canspin.annotation import Annotation
 from gitma_canspin.tag import Tag
 from gitma_canspin._write_annotation import write_annotation_json
 from gitma_canspin._gold_annotation import create_gold_annotations
-from gitma_canspin._vizualize import plot_interactive, plot_annotation_progression
-from gitma_canspin._metrics import get_annotation_pairs, get_iaa_data, get_confusion_matrix, gamma_agreement
+from gitma_canspin._metrics import get_annotation_pairs, get_iaa_data, get_iaa_scores, get_confusion_matrix, gamma_agreement
+
+try:
+    # orjson parses the annotation collection headers faster than the json module, it is used if it is installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+if TYPE_CHECKING:
+    # pandas and plotly are imported by the methods that need them
+    import pandas as pd
+    import plotly.graph_objects as go
 
 import logging
 logger = logging.getLogger(__name__)
 
+#: Format string for the results printed by `CatmaProject.get_iaa`.
+iaa_results_template = (
+    '\n'
+    'Results for "{level}"\n'
+    '-------------{dashes}-\n'
+    "Scott's Pi:          {pi}\n"
+    "Cohen's Kappa:       {kappa}\n"
+    "Krippendorf's Alpha: {alpha}\n"
+    '===============================================\n'
+)
+
+#: Directory with bare mirrors of already cloned CATMA projects, used as object store for repeated clones.
+mirrors_directory = os.path.join(os.path.expanduser('~'), '.cache', 'gitma_canspin', 'mirrors')
+
+
+def get_git_auth_env(gitlab_access_token: str) -> Dict[str, str]:
+    """Returns an environment for git subprocesses that authenticates against CATMA's GitLab backend.
+    The token is passed as configuration through environment variables, so it neither shows up in the process list\
+    nor gets stored in any git config. Requires git 2.31 or newer.
+
+    Args:
+        gitlab_access_token (str): A valid access token for CATMA's GitLab backend.
+
+    Returns:
+        Dict[str, str]: The current environment extended by the authorization header config.
+    """
+    credentials = base64.b64encode(f'none:{gitlab_access_token}'.encode()).decode()
+    return {
+        **os.environ,
+        'GIT_CONFIG_COUNT': '1',
+        'GIT_CONFIG_KEY_0': 'http.extraHeader',
+        'GIT_CONFIG_VALUE_0': f'Authorization: Basic {credentials}'
+    }
+
+
+def clone_with_local_mirror(
+        url: str,
+        path: str,
+        mirror_path: str,
+        gitlab_access_token: str) -> bool:
+    """Clones a CATMA project using a local bare mirror as reference, so only objects missing in the mirror get downloaded.
+    The mirror is refreshed before cloning. If no mirror exists yet or the clone path already exists, nothing is cloned.
+
+    Args:
+        url (str): The project's GitLab repository URL.
+        path (str): Where to clone the project.
+        mirror_path (str): The path of the project's bare mirror.
+        gitlab_access_token (str): A valid access token for CATMA's GitLab backend.
+
+    Returns:
+        bool: True if the project was cloned, False if no mirror exists, the clone path exists, git is not installed or a git command failed.
+    """
+    # an existing clone path may hold local changes, so it is left to the regular clone
+    if not os.path.isdir(mirror_path) or os.path.exists(path) or not shutil.which('git'):
+        return False
+
+    git_env = get_git_auth_env(gitlab_access_token)
+
+    # the errors are logged without the subprocess details, which could contain the remote's credentials
+    try:
+        subprocess.run(['git', '--git-dir', mirror_path, 'fetch', '--all', '--prune'], check=True, env=git_env)
+    except subprocess.CalledProcessError as e:
+        logger.warning(f'Could not refresh the local mirror at {mirror_path} (git exit status {e.returncode}).')
+        return False
+
+    try:
+        subprocess.run(['git', 'clone', '--reference', mirror_path, '--dissociate', url, path], check=True, env=git_env)
+    except subprocess.CalledProcessError as e:
+        logger.warning(f'Could not clone the project using the local mirror at {mirror_path} (git exit status {e.returncode}).')
+        # the clone path did not exist before, so only the partial clone is removed
+        shutil.rmtree(path, ignore_errors=True)
+        return False
+
+    return True
+
+
+def create_local_mirror(url: str, path: str, mirror_path: str) -> None:
+    """Creates a bare mirror of a freshly cloned CATMA project, which is used by `clone_with_local_mirror` for later clones.
+    The mirror is copied from the local clone, so nothing gets downloaded.
+
+    Args:
+        url (str): The project's GitLab repository URL, set as the mirror's remote.
+        path (str): The path of the local clone.
+        mirror_path (str): The path of the mirror to be created.
+    """
+    if os.path.isdir(mirror_path) or not shutil.which('git'):
+        return
+
+    try:
+        os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+        subprocess.run(['git', 'clone', '--mirror', '--quiet', path, mirror_path], check=True)
+        subprocess.run(['git', '--git-dir', mirror_path, 'remote', 'set-url', 'origin', url], check=True)
+    except (OSError, subprocess.CalledProcessError):
+        logger.warning(f'Could not create a local mirror at {mirror_path}.', exc_info=True)
+        shutil.rmtree(mirror_path, ignore_errors=True)
+
+
 def load_gitlab_project(
         gitlab_access_token: str,
         project_name: str,
-        backup_directory: str = './') -> str:
+        backup_directory: str = './',
+        use_local_mirror: bool = False) -> str:
     """Loads a CATMA project from the GitLab backend.
 
     Args:
         gitlab_access_token (str): A valid access token for CATMA's GitLab backend.
         project_name (str): The CATMA project name (or a part thereof - a search is performed in the GitLab backend using this value).
         backup_directory (str, optional): Where to clone the CATMA project. Defaults to './'.
+        use_local_mirror (bool, optional): Whether to keep a bare mirror of the project in `mirrors_directory`\
+            (`~/.cache/gitma_canspin/mirrors`) and use it as reference for repeated clones, so only new objects get downloaded.\
+            The mirror is a second full copy of the project. Requires git 2.31 or newer to be installed. Defaults to False.
 
     Raises:
         Exception: If no CATMA project with the given name could be found.
@@ -49,16 +160,29 @@ def load_gitlab_project(
 
     gitlab_project = gl.projects.get(id=gitlab_project_id)
 
+    clone_path = os.path.join(backup_directory, gitlab_project.name)
+    mirror_path = os.path.join(mirrors_directory, f'{gitlab_project.name}.git')
+
+    if use_local_mirror and clone_with_local_mirror(
+            url=gitlab_project.http_url_to_repo,
+            path=clone_path,
+            mirror_path=mirror_path,
+            gitlab_access_token=gitlab_access_token):
+        return gitlab_project.name
+
     # clone the project in the defined directory
     creds = pygit2.UserPass('none', gitlab_access_token)
     callbacks = pygit2.RemoteCallbacks(credentials=creds)
     pygit2.clone_repository(
         url=gitlab_project.http_url_to_repo,
-        path=backup_directory + gitlab_project.name,
+        path=clone_path,
         bare=False,
         callbacks=callbacks
     )
 
+    if use_local_mirror:
+        create_local_mirror(url=gitlab_project.http_url_to_repo, path=clone_path, mirror_path=mirror_path)
+
     return gitlab_project.name
 
 
@@ -96,28 +220,101 @@ def get_local_project_uuid(
         return project_uuids[0]
 
 
-def get_ac_name(project_uuid: str, directory: str) -> str:
+def get_ac_name(project_root: str, directory: str) -> str:
     """Gets an annotation collection's name.
 
     Args:
-        project_uuid (str): CATMA project UUID
+        project_root (str): CATMA project directory
         directory (str): annotation collection directory
-        test_positive (bool, optional): what should be returned if it is intrinsic markup. Defaults to True.
 
     Returns:
         str: annotation collection name
     """
-    with open(f'{project_uuid}/collections/{directory}/header.json', 'r', encoding='utf-8', newline='') as header_input:
-        header_dict = json.load(header_input)
+    # read as bytes, both parsers decode UTF-8 themselves
+    with open(os.path.join(project_root, 'collections', directory, 'header.json'), 'rb') as header_input:
+        header_dict = json_loads(header_input.read())
 
     return header_dict['name']
 
 
+#: Name of the file in the project directory that caches the project's directory listings between loads.
+manifest_file_name = '.gitma_manifest.json'
+
+
+def get_directory_mtimes(project_root: str) -> Dict[str, int]:
+    """Gets the modification times of the project's tagsets, documents and collections directories.
+
+    Args:
+        project_root (str): CATMA project directory
+
+    Returns:
+        Dict[str, int]: Directory names as keys and modification times in nanoseconds as values.
+    """
+    return {
+        directory: os.stat(os.path.join(project_root, directory)).st_mtime_ns
+        for directory in ['tagsets', 'documents', 'collections']
+        if os.path.isdir(os.path.join(project_root, directory))
+    }
+
+
+def write_manifest(project_root: str, tagsets: List[Tagset], texts: List[Text]) -> None:
+    """Writes the project's directory listings, annotation collection names and header modification times to the manifest file.
+
+    Args:
+        project_root (str): CATMA project directory
+        tagsets (List[Tagset]): The loaded tagsets.
+        texts (List[Text]): The loaded texts.
+    """
+    collections_directory = os.path.join(project_root, 'collections')
+    manifest = {
+        'directories': get_directory_mtimes(project_root),
+        'tagsets': [tagset.uuid for tagset in tagsets],
+        'texts': [text.uuid for text in texts],
+        'collections': [
+            {
+                'uuid': directory,
+                'name': get_ac_name(project_root, directory),
+                'header_mtime': os.stat(os.path.join(collections_directory, directory, 'header.json')).st_mtime_ns
+            } for directory in os.listdir(collections_directory)
+            if os.path.isfile(os.path.join(collections_directory, directory, 'header.json'))
+        ]
+    }
+
+    with open(os.path.join(project_root, manifest_file_name), 'w', encoding='utf-8', newline='') as manifest_output:
+        json.dump(manifest, manifest_output)
+
+
+def load_manifest(project_root: str) -> Union[dict, None]:
+    """Loads the project's manifest file if none of the directories and annotation collection headers it refers to have changed since it was written.
+
+    Args:
+        project_root (str): CATMA project directory
+
+    Returns:
+        Union[dict, None]: The manifest or None, if it does not exist or is outdated.
+    """
+    try:
+        with open(os.path.join(project_root, manifest_file_name), 'r', encoding='utf-8', newline='') as manifest_input:
+            manifest = json.load(manifest_input)
+
+        if manifest['directories'] != get_directory_mtimes(project_root):
+            return None
+
+        for collection in manifest['collections']:
+            if os.stat(os.path.join(project_root, 'collections', collection['uuid'], 'header.json')).st_mtime_ns != collection['header_mtime']:
+                return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    return manifest
+
+
 def load_annotation_collections(
         catma_project,
         included_acs: list = None,
         excluded_acs: list = None,
-        ac_filter_keyword: str = None) -> Tuple[List[AnnotationCollection], Dict[str, AnnotationCollection]]:
+        ac_filter_keyword: str = None,
+        ac_names: Dict[str, str] = None) -> Tuple[List[AnnotationCollection], Dict[str, AnnotationCollection]]:
     """Generates List and Dict of CATMA Annotation Collections.
 
     Args:
@@ -125,43 +322,56 @@ def load_annotation_collections(
         included_acs (list): All listed Annotation Collections get loaded.
         excluded_acs (list): All listed Annotations Collections don't get loaded.\
             If neither included nor excluded Annotation Collections are defined, all Annotation Collections get loaded.
+        ac_names (Dict[str, str], optional): Annotation Collection directories mapped to their names, e.g. taken from the project's manifest.\
+            If given, the collections directory is not listed and the names are not read from the header files. Defaults to None.
 
     Returns:
         Tuple[List[AnnotationCollection], Dict[str, AnnotationCollection]]: List and Dict of Annotation Collections
     """
-    collections_directory = catma_project.uuid + '/collections/'
+    collections_directory = os.path.join(catma_project.project_root, 'collections')
+    directories = list(ac_names) if ac_names is not None else os.listdir(collections_directory)
+
+    # sets allow constant time membership tests for every annotation collection directory,
+    # a single name given as string keeps being tested with the substring semantics of `in`
+    if included_acs and not isinstance(included_acs, str):
+        included_acs = frozenset(included_acs)
+    if excluded_acs and not isinstance(excluded_acs, str):
+        excluded_acs = frozenset(excluded_acs)
+
+    def _get_name(directory: str) -> str:
+        return ac_names[directory] if ac_names is not None else get_ac_name(catma_project.project_root, directory)
 
     if included_acs:        # selects annotation collections listed in included_acs
         annotation_collections = [
             AnnotationCollection(
                 catma_project=catma_project,
                 ac_uuid=directory
-            ) for directory in os.listdir(collections_directory)
-            if get_ac_name(catma_project.uuid, directory) in included_acs
+            ) for directory in directories
+            if _get_name(directory) in included_acs
         ]
     elif excluded_acs:      # selects all annotation collections except for the excluded_acs
         annotation_collections = [
             AnnotationCollection(
                 catma_project=catma_project,
                 ac_uuid=directory
-            ) for directory in os.listdir(collections_directory)
-            if get_ac_name(catma_project.uuid, directory) not in excluded_acs
+            ) for directory in directories
+            if _get_name(directory) not in excluded_acs
         ]
     elif ac_filter_keyword:  # selects annotation collections with the given ac_filter_keyword
         annotation_collections = [
             AnnotationCollection(
                 catma_project=catma_project,
                 ac_uuid=directory
-            ) for directory in os.listdir(collections_directory)
-            if ac_filter_keyword in get_ac_name(catma_project.uuid, directory)
+            ) for directory in directories
+            if ac_filter_keyword in _get_name(directory)
         ]
     else:                   # selects all annotation collections
         annotation_collections = [
             AnnotationCollection(
                 catma_project=catma_project,
                 ac_uuid=directory
-            ) for directory in os.listdir(collections_directory)
-            if directory.startswith('C_') or directory.startswith('CATMA_')
+            ) for directory in directories
+            if directory.startswith(('C_', 'CATMA_'))
         ]
 
     ac_dict = {
@@ -171,61 +381,76 @@ def load_annotation_collections(
 
 
 def test_tageset_directory(
-        project_uuid: str,
+        project_root: str,
         tagset_uuid: str) -> bool:
     """Tests if Tagset has header.json to filter empty Tagsets from loading process.
 
     Args:
-        project_uuid (str): UUID.
+        project_root (str): CATMA project directory.
         tagset_uuid (str): UUID.
 
     Returns:
         boolean: True if header.json exists.
     """
-    tageset_dir = f'{project_uuid}/tagsets/{tagset_uuid}/header.json'
+    tageset_dir = os.path.join(project_root, 'tagsets', tagset_uuid, 'header.json')
     if os.path.isfile(tageset_dir):
         return True
 
 
-def load_tagsets(project_uuid: str) -> Tuple[List[Tagset], Dict[str, Tagset]]:
+def load_tagsets(project_root: str, tagset_uuids: List[str] = None) -> Tuple[List[Tagset], Dict[str, Tagset]]:
     """Generates List and Dict of Tagsets.
 
     Args:
-        project_uuid (str): CATMA Project UUID.
+        project_root (str): CATMA Project directory.
+        tagset_uuids (List[str], optional): UUIDs of the non-empty tagsets, e.g. taken from the project's manifest.\
+            If given, the tagsets directory is not scanned. Defaults to None.
 
     Returns:
         Tuple[List[Tagset], Dict[str, Tagset]]: Tagsets as list and dictionary with UUIDs as keys.
     """
-    tagsets_directory = project_uuid + '/tagsets/'
+    if tagset_uuids is None:
+        tagsets_directory = os.path.join(project_root, 'tagsets')
+        tagset_uuids = [
+            directory for directory in os.listdir(tagsets_directory)
+            # ignore empty tagsets
+            if test_tageset_directory(project_root, directory)
+        ]
+
     tagsets = [
         Tagset(
-            project_uuid=project_uuid,
-            tagset_uuid=directory
-        ) for directory in os.listdir(tagsets_directory)
-        # ignore empty tagsets
-        if test_tageset_directory(project_uuid, directory)
+            project_uuid=project_root,
+            tagset_uuid=tagset_uuid
+        ) for tagset_uuid in tagset_uuids
     ]
     tagset_dict = {tagset.uuid: tagset for tagset in tagsets}
 
     return tagsets, tagset_dict
 
 
-def load_texts(project_uuid: str) -> Tuple[List[Text], Dict[str, Text]]:
+def load_texts(project_root: str, text_uuids: List[str] = None) -> Tuple[List[Text], Dict[str, Text]]:
     """Generates List and Dict of CATMA Texts.
 
     Args:
-        project_uuid (str): CATMA Project UUID
+        project_root (str): CATMA Project directory
+        text_uuids (List[str], optional): UUIDs of the documents, e.g. taken from the project's manifest.\
+            If given, the documents directory is not scanned. Defaults to None.
 
     Returns:
         Tuple[List[Text], Dict[Text]]: List and dictionary of documents.
     """
-    texts_directory = project_uuid + '/documents/'
+    if text_uuids is None:
+        texts_directory = os.path.join(project_root, 'documents')
+        text_uuids = [
+            directory for directory in os.listdir(texts_directory)
+            # document directories are always prefixed with 'D_', everything else is ignored
+            if directory.startswith('D_')
+        ]
+
     texts = [
         Text(
-            project_uuid=project_uuid,
-            document_uuid=directory
-        ) for directory in os.listdir(texts_directory)
-        if directory.startswith('D_')
+            project_uuid=project_root,
+            document_uuid=text_uuid
+        ) for text_uuid in text_uuids
     ]
 
     texts_dict = {text.title: text for text in texts}
@@ -250,6 +475,8 @@ class CatmaProject:
         load_from_gitlab (bool, optional): Whether the CATMA project should be loaded directly from CATMA's GitLab backend. Defaults to False.
         gitlab_access_token (str, optional): The private CATMA GitLab access token. Defaults to None.
         backup_directory (str, optional): The directory where your project clone should be located. Defaults to './'.
+        use_local_mirror (bool, optional): Whether a project loaded from GitLab should be cloned using a local bare mirror,\
+            see `load_gitlab_project`. Defaults to False.
 
     Raises:
         FileNotFoundError: If the local or remote CATMA project was not found.
@@ -263,10 +490,8 @@ class CatmaProject:
             ac_filter_keyword: str = None,
             load_from_gitlab: bool = False,
             gitlab_access_token: str = None,
-            backup_directory: str = './'):
-        # get the current directory, to return to after loading the project
-        cwd = os.getcwd()
-
+            backup_directory: str = './',
+            use_local_mirror: bool = False):
         # TODO: what we're calling UUID here is actually the full GitLab project name, which is unlikely to change and contains a UUID
         #       the CATMA project name is stored in the GitLab project description field and can change
         if load_from_gitlab:
@@ -274,7 +499,8 @@ class CatmaProject:
             self.uuid: str = load_gitlab_project(  # clones the CATMA project
                 gitlab_access_token=gitlab_access_token,
                 project_name=project_name,
-                backup_directory=backup_directory
+                backup_directory=backup_directory,
+                use_local_mirror=use_local_mirror
             )
             projects_directory = backup_directory
         else:
@@ -290,19 +516,28 @@ class CatmaProject:
         #: The project's name.
         self.name: str = self.uuid[43:]  # NB: the actual name can be different if the project is renamed or the name contains whitespace or special characters
 
-        if not os.path.isdir(self.projects_directory) or not os.path.isdir(f'{self.projects_directory}/{self.uuid}'):
+        #: The absolute path of the project's directory, all project files are loaded relative to it.
+        self.project_root: str = os.path.join(os.path.abspath(self.projects_directory), self.uuid)
+
+        if not os.path.isdir(self.projects_directory) or not os.path.isdir(self.project_root):
             raise FileNotFoundError(
                 f'The CATMA project "{self.uuid}" could not been found in this directory: {self.projects_directory}. '
                 f'Make sure the project clone worked properly and that the projects_directory parameter is correct.'
             )
 
-        os.chdir(self.projects_directory)  # everything following is relative to this directory
-
         try:
+            # reuse the directory listings of the last load if nothing changed since then
+            manifest = load_manifest(project_root=self.project_root)
+            if manifest:
+                logger.info('Using the project manifest of the last load ...')
+
             # Load tagsets
             logger.info('Loading tagsets ...')
-            if os.path.isdir(self.uuid + '/tagsets/'):
-                tagsets = load_tagsets(project_uuid=self.uuid)
+            if os.path.isdir(os.path.join(self.project_root, 'tagsets')):
+                tagsets = load_tagsets(
+                    project_root=self.project_root,
+                    tagset_uuids=manifest['tagsets'] if manifest else None
+                )
 
                 #: List of gitma_canspin.Tagset objects.
                 self.tagsets: List[Tagset] = tagsets[0]
@@ -316,7 +551,10 @@ class CatmaProject:
 
             # Load texts
             logger.info('Loading documents ...')
-            texts = load_texts(project_uuid=self.uuid)
+            texts = load_texts(
+                project_root=self.project_root,
+                text_uuids=manifest['texts'] if manifest else None
+            )
 
             #: List of the gitma_canspin.Text objects.
             self.texts: List[Text] = texts[0]
@@ -332,6 +570,7 @@ class CatmaProject:
                 included_acs=included_acs,
                 excluded_acs=excluded_acs,
                 ac_filter_keyword=ac_filter_keyword,
+                ac_names={ac['uuid']: ac['name'] for ac in manifest['collections']} if manifest else None
             )
             #: List of gitma_canspin.AnnotationCollection objects.
             self.annotation_collections: List[AnnotationCollection] = annotation_collections[0]
@@ -343,13 +582,21 @@ class CatmaProject:
                 logger.info(f'\tAnnotation collection "{ac.name}" for document "{ac.text.title}"')
                 logger.info(f'\t\tAnnotations: {len(ac.annotations)}')
 
+            #: List of the annotation collections with at least one annotation, used by the plot and network methods.
+            self._nonempty_acs: List[AnnotationCollection] = [
+                ac for ac in self.annotation_collections if ac.annotations]
+
+            if not manifest:
+                try:
+                    write_manifest(project_root=self.project_root, tagsets=self.tagsets, texts=self.texts)
+                except (OSError, ValueError, KeyError, TypeError):
+                    logger.warning('Could not write the project manifest.', exc_info=True)
+
         except FileNotFoundError:
             raise FileNotFoundError(
                 f"Some components of your CATMA project could not be loaded."
             )
 
-        os.chdir(cwd)
-
     def __repr__(self):
         documents = [text.title for text in self.texts]
         tagsets = [tagset.name for tagset in self.tagsets]
@@ -366,13 +613,12 @@ class CatmaProject:
 
         print(f'\nAnnotation collection list:\nindex\tcollection_name\ttext_title')
 
-        if isinstance(filter_for_text, str):
-            for index, annotation_collection in enumerate(self.annotation_collections):
-                print(f'{index}\t{annotation_collection.name}\t{annotation_collection.text.title}') if (filter_for_text in annotation_collection.text.title) else None
-            return
-        
+        filter_active = isinstance(filter_for_text, str)
+
         for index, annotation_collection in enumerate(self.annotation_collections):
-            print(f'{index}\t{annotation_collection.name}\t{annotation_collection.text.title}')
+            text_title = annotation_collection.text.title
+            if not filter_active or filter_for_text in text_title:
+                print(f'{index}\t{annotation_collection.name}\t{text_title}')
 
     def to_json(self,
         annotation_collections: Union[List[str], str] = 'all',
@@ -390,49 +636,55 @@ class CatmaProject:
         
         if annotation_collections == 'all':
             annotation_collections = self.annotation_collections
-        else:
+        elif isinstance(annotation_collections, str):
             annotation_collections = [ac for ac in self.annotation_collections if ac.name in annotation_collections]
+        else:
+            annotation_collections = [self.ac_dict[name] for name in dict.fromkeys(annotation_collections) if name in self.ac_dict]
 
         if not rename_dict:
             rename_dict = {ac.name: ac.name for ac in annotation_collections}
 
-        output_dict = {}
+        # group the annotation collections by document title
+        document_acs = {}
         for ac in annotation_collections:
-            if ac.text.title not in output_dict:
-                output_dict[ac.text.title] = {rename_dict[ac.name]: ac.to_list(tags=included_tags)}
-            else:
-                output_dict[ac.text.title][rename_dict[ac.name]] = ac.to_list(tags=included_tags)
+            document_acs.setdefault(ac.text.title, {})[rename_dict[ac.name]] = ac
 
+        # write the JSON object collection by collection, so only one annotation list is held in memory at a time
         with open(f'{directory}{self.name}.json', 'w', encoding='utf-8', newline='') as json_output:
-            json_output.write(json.dumps(output_dict))
+            json_output.write('{')
+            for document_index, (text_title, acs) in enumerate(document_acs.items()):
+                if document_index:
+                    json_output.write(', ')
+                json_output.write(f'{json.dumps(text_title)}: {{')
+                for ac_index, (ac_name, ac) in enumerate(acs.items()):
+                    if ac_index:
+                        json_output.write(', ')
+                    json_output.write(f'{json.dumps(ac_name)}: {json.dumps(ac.to_list(tags=included_tags))}')
+                json_output.write('}')
+            json_output.write('}')
 
     def update(self) -> None:
         """Updates local git folder and reloads CatmaProject.
 
         Warning: This method can only be used if you have [Git](https://git-scm.com/book/en/v2/Getting-Started-Installing-Git) installed.
         """
-        cwd = os.getcwd()
-        os.chdir(f'{self.projects_directory}{self.uuid}/')
-
-        subprocess.run(['git', 'pull'])
+        subprocess.run(['git', 'pull'], cwd=self.project_root)
 
-        os.chdir('../')
         # Load Tagsets
-        self.tagsets, self.tagset_dict = load_tagsets(project_uuid=self.uuid)
+        self.tagsets, self.tagset_dict = load_tagsets(project_root=self.project_root)
 
         # Load Texts
-        self.texts, self.text_dict = load_texts(project_uuid=self.uuid)
+        self.texts, self.text_dict = load_texts(project_root=self.project_root)
 
         # Load Annotation Collections
         self.annotation_collections, self.ac_dict = load_annotation_collections(
             catma_project=self,
             included_acs=list(self.ac_dict)
         )
+        self._nonempty_acs = [ac for ac in self.annotation_collections if ac.annotations]
 
         logger.info('Update routine complete.')
 
-        os.chdir(cwd)
-
     def annotations(self) -> Generator[Annotation, None, None]:
         """Generator that yields all annotations as gitma_canspin.annotation.Annotation objects.
 
@@ -453,28 +705,52 @@ class CatmaProject:
             for tag in tagset.tags:
                 yield tag
 
-    def stats(self) -> pd.DataFrame:
+    def stats(self) -> 'pd.DataFrame':
         """Shows some CATMA Project stats.
 
         Returns:
             pd.DataFrame: DataFrame with projects stats sorted by the Annotation Collection names.
         """
-        ac_stats = [
-            {
-                'annotation collection': ac.name,
-                'document': ac.text.title,
-                'annotations': len(ac.annotations),
-                'annotator': set([an.author for an in ac.annotations]),
-                'tag': set([an.tag.name for an in ac.annotations]),
-                'first_annotation': min([an.date for an in ac.annotations]),
-                'last_annotation': max([an.date for an in ac.annotations]),
-                'uuid': ac.uuid,
-            } for ac in self.annotation_collections
-            if len(ac.annotations) > 0
-        ]
+        import pandas as pd
 
-        df = pd.DataFrame(ac_stats).sort_values(
-            by=['annotation collection']).reset_index(drop=True)
+        # collect the stats column by column in a single pass over each collection's annotations
+        names, documents, counts, annotators, tags, first_annotations, last_annotations, uuids = [], [], [], [], [], [], [], []
+        for ac in self.annotation_collections:
+            annotations = ac.annotations
+            if not annotations:
+                continue
+            ac_annotators, ac_tags = set(), set()
+            first_annotation = last_annotation = annotations[0].date
+            for an in annotations:
+                ac_annotators.add(an.author)
+                ac_tags.add(an.tag.name)
+                date = an.date
+                if date < first_annotation:
+                    first_annotation = date
+                if date > last_annotation:
+                    last_annotation = date
+
+            names.append(ac.name)
+            documents.append(ac.text.title)
+            counts.append(len(annotations))
+            annotators.append(ac_annotators)
+            tags.append(ac_tags)
+            first_annotations.append(first_annotation)
+            last_annotations.append(last_annotation)
+            uuids.append(ac.uuid)
+
+        df = pd.DataFrame(
+            {
+                'annotation collection': names,
+                'document': documents,
+                'annotations': counts,
+                'annotator': annotators,
+                'tag': tags,
+                'first_annotation': first_annotations,
+                'last_annotation': last_annotations,
+                'uuid': uuids,
+            }
+        ).sort_values(by=['annotation collection']).reset_index(drop=True)
         return df
 
     def write_annotation_json(
@@ -549,17 +825,19 @@ class CatmaProject:
             push_to_gitlab=push_to_gitlab
         )
 
-    def merge_annotations(self) -> pd.DataFrame:
+    def merge_annotations(self) -> 'pd.DataFrame':
         """Concatenates all annotation collections to one pandas data frame and resets index.
 
         Returns:
             pd.DataFrame: Data frame including all annotation in the CATMA project.
         """
+        import pandas as pd
+
         return pd.concat(
             [ac.df for ac in self.annotation_collections if not ac.df.empty]
         ).reset_index(drop=True)
 
-    def merge_annotations_per_document(self) -> Dict[str, pd.DataFrame]:
+    def merge_annotations_per_document(self) -> Dict[str, 'pd.DataFrame']:
         """Merges all annotations per document to one annotation collection.
 
         Returns:
@@ -575,15 +853,16 @@ class CatmaProject:
 
         return document_acs
 
-    def plot_annotation_progression(self) -> go.Figure:
+    def plot_annotation_progression(self) -> 'go.Figure':
         """Plot the annotation progression for every annotator in a CATMA project.
 
         Returns:
             go.Figure: Plotly scatter plot.
         """
+        from gitma_canspin._vizualize import plot_annotation_progression
         return plot_annotation_progression(project=self)
 
-    def plot_interactive(self, color_col: str = 'annotation collection') -> go.Figure:
+    def plot_interactive(self, color_col: str = 'annotation collection') -> 'go.Figure':
         """This function generates one Plotly scatter plot per annotated document in a CATMA project.
         By default the colors represent the annotation collections.
         By that they can be deactivated with the interactive legend.
@@ -594,9 +873,10 @@ class CatmaProject:
         Returns:
             go.Figure: Plotly scatter plot.
         """
-        return plot_interactive(catma_project=self, color_col=color_col)
+        from gitma_canspin._vizualize import plot_interactive
+        return plot_interactive(annotation_collections=self._nonempty_acs, color_col=color_col)
 
-    def plot_annotations(self, color_col: str = 'annotation collection') -> go.Figure:
+    def plot_annotations(self, color_col: str = 'annotation collection') -> 'go.Figure':
         """This function generates one Plotly scatter plot per annotated document in a CATMA project.
         By default the colors represent the annotation collections.
         By that they can be deactivated with the interactive legend.
@@ -607,7 +887,8 @@ class CatmaProject:
         Returns:
             go.Figure: Plotly scatter plot.
         """
-        return plot_interactive(catma_project=self, color_col=color_col)
+        from gitma_canspin._vizualize import plot_interactive
+        return plot_interactive(annotation_collections=self._nonempty_acs, color_col=color_col)
 
     def cooccurrence_network(
         self,
@@ -639,11 +920,11 @@ class CatmaProject:
         """
         if isinstance(annotation_collections, list):
             plot_acs = [
-                ac for ac in self.annotation_collections
-                if ac.name in annotation_collections
+                self.ac_dict[name] for name in dict.fromkeys(annotation_collections)
+                if name in self.ac_dict and self.ac_dict[name].annotations
             ]
         else:
-            plot_acs = self.annotation_collections
+            plot_acs = self._nonempty_acs
 
         from gitma_canspin._network import Network
         nw = Network(
@@ -683,11 +964,11 @@ class CatmaProject:
         """
         if isinstance(annotation_collections, list):
             plot_acs = [
-                ac for ac in self.annotation_collections
-                if ac.name in annotation_collections
+                self.ac_dict[name] for name in dict.fromkeys(annotation_collections)
+                if name in self.ac_dict and self.ac_dict[name].annotations
             ]
         else:
-            plot_acs = self.annotation_collections
+            plot_acs = self._nonempty_acs
 
         from gitma_canspin._network import Network
         nw = Network(
@@ -706,7 +987,7 @@ class CatmaProject:
     def compare_annotation_collections(
         self,
         annotation_collections: List[str],
-        color_col: str = 'tag') -> go.Figure:
+        color_col: str = 'tag') -> 'go.Figure':
         """Plots annotations of multiple annotation collections of the same texts as line plot.
 
         Args:
@@ -735,7 +1016,8 @@ class CatmaProject:
         level: str = 'tag',
         include_empty_annotations: bool = True,
         distance: str = 'binary',
-        return_as_dict: bool = False) -> None:
+        return_as_dict: bool = False,
+        return_confusion_matrix: bool = True) -> None:
         """Computes Inter Annotator Agreement for 2 Annotation Collections.
         See the [demo notebook](https://github.com/forTEXT/gitma/blob/main/demo/notebooks/inter_annotator_agreement.ipynb)
         for details.
@@ -752,8 +1034,10 @@ class CatmaProject:
                 get included. Defaults to True.
             distance (str, optional): The IAA distance function. Either 'binary' or 'interval'.\
             See the [NLTK API](https://www.nltk.org/api/nltk.metrics.html) for further informations. Defaults to 'binary'.
+            return_as_dict (bool, optional): If `True` the scores are returned as dict. Defaults to False.
+            return_confusion_matrix (bool, optional): If `False` only Krippendorf's Alpha is returned and no confusion matrix\
+                gets computed. Ignored if `return_as_dict=True`. Defaults to True.
         """
-        from nltk.metrics.agreement import AnnotationTask
         from nltk.metrics import interval_distance, binary_distance
 
         if distance == 'interval':
@@ -774,29 +1058,18 @@ class CatmaProject:
                 'prop:', '') if 'prop:' in level else None
         )
 
-        # transform annotation pairs to data format the nltk AnnotationTask class takes as input
-        data = list(get_iaa_data(annotation_pairs, level=level, include_empty_annotations=include_empty_annotations))
-
-        annotation_task = AnnotationTask(data=data, distance=distance_function)
+        # count the label combinations of the annotation pairs while consuming the data generator:
+        # get_iaa_data yields the first and the second coder's label per item one after another
+        iaa_data = get_iaa_data(annotation_pairs, level=level, include_empty_annotations=include_empty_annotations)
+        label_pairs = Counter((label1, label2) for (_, _, label1), (_, _, label2) in zip(iaa_data, iaa_data))
 
         try:
-            pi = annotation_task.pi()
-            kappa = annotation_task.kappa()
-            alpha = annotation_task.alpha()
+            pi, kappa, alpha = get_iaa_scores(label_pairs=label_pairs, distance_function=distance_function)
         except ZeroDivisionError:
             print(f"Couldn't find compute IAA for {level} due to missing overlapping annotations with the given settings.")
             pi, kappa, alpha = (0, 0, 0)
 
-        print(textwrap.dedent(
-            f"""
-            Results for "{level}"
-            -------------{len(level) * '-'}-
-            Scott's Pi:          {pi}
-            Cohen's Kappa:       {kappa}
-            Krippendorf's Alpha: {alpha}
-            ===============================================
-            """
-        ))
+        print(iaa_results_template.format(level=level, dashes=len(level) * '-', pi=pi, kappa=kappa, alpha=alpha))
 
         if return_as_dict:
             return {
@@ -804,12 +1077,10 @@ class CatmaProject:
                 "Cohen's Kappa": kappa,
                 "Krippendorf's Alpha": alpha
             }
+        elif not return_confusion_matrix:
+            return alpha
         else:
-            print(textwrap.dedent(
-                f"""Confusion Matrix
-                -------
-                """
-            ))
+            print('Confusion Matrix\n-------\n')
             return get_confusion_matrix(pair_list=annotation_pairs, level=level)
 
     def gamma_agreement(
@@ -830,7 +1101,7 @@ class CatmaProject:
             precision_level=precision_level
         )
 
-    def pygamma_table(self, annotation_collections: Union[str, list] = 'all') -> pd.DataFrame:
+    def pygamma_table(self, annotation_collections: Union[str, list] = 'all') -> 'pd.DataFrame':
         """Concatenates annotation collections to pygamma table.
 
         Args:
@@ -839,21 +1110,19 @@ class CatmaProject:
         Returns:
             pd.DataFrame: Concatenated annotation collections as pd.DataFrame in pygamma format.
         """
-        if annotation_collections == 'all':
-            return pd.concat(
-                [
-                    ac.to_pygamma_table() for ac in self.annotation_collections
-                    if not ac.df.empty
-                ]
-            )
-        else:
-            return pd.concat(
-                [
-                    ac.to_pygamma_table() for ac in self.annotation_collections
-                    if ac.name in annotation_collections and not ac.df.empty
-                ]
-            )
+        import pandas as pd
+
+        if annotation_collections != 'all' and not isinstance(annotation_collections, str):
+            annotation_collections = frozenset(annotation_collections)
+
+        def _iter_tables(selected_acs: Union[str, frozenset]) -> Generator['pd.DataFrame', None, None]:
+            for ac in self.annotation_collections:
+                if ac.df.empty:
+                    continue
+                if selected_acs == 'all' or ac.name in selected_acs:
+                    yield ac.to_pygamma_table()
 
+        return pd.concat(list(_iter_tables(annotation_collections)), axis=0, ignore_index=True, copy=False)
 
 if __name__ == '__main__':
     project = CatmaProject(
@@ -12,24 +12,41 @@ logging.basicConfig(format='%(name)s - %(levelname)s - %(message)s', level=loggi
 
 this_file = os.path.abspath(__file__)
 
+streamlit_flag_options = {
+    "theme_base": "light",
+    "browser_gatherUsageStats": False,
+    "logger_messageFormat": "%(asctime)s %(levelname) -7s %(name)s: %(message)s",
+}
+
 def run():
     logger.info("GUI started.")
     args = sys.argv
-    subprocess.call(
-        [
-            "streamlit",
-            "run",
-            this_file,
-            "--theme.base",
-            "light",
-            "--browser.gatherUsageStats",
-            "false",
-            "--logger.messageFormat",
-            "%(asctime)s %(levelname) -7s %(name)s: %(message)s",
-            "--",
-            *args,
-        ]
-    )
+    try:
+        from streamlit.web import bootstrap
+        from streamlit.runtime.credentials import check_credentials
+    except ImportError:
+        # streamlit versions without the bootstrap module are started as separate process
+        subprocess.call(
+            [
+                "streamlit",
+                "run",
+                this_file,
+                "--theme.base",
+                "light",
+                "--browser.gatherUsageStats",
+                "false",
+                "--logger.messageFormat",
+                "%(asctime)s %(levelname) -7s %(name)s: %(message)s",
+                "--",
+                *args,
+            ]
+        )
+        return
+
+    # start the streamlit server in this interpreter, like "streamlit run" does after parsing its flags
+    bootstrap.load_config_options(flag_options=streamlit_flag_options)
+    check_credentials()
+    bootstrap.run(this_file, False, args, streamlit_flag_options)
 
 def main():
     parser = argparse.ArgumentParser(description="The gitma_CANSpiN app")
@@ -7,29 +7,35 @@ from gitma_canspin.canspin import CanspinProject
 def change_test_dir(request, monkeypatch):
     monkeypatch.chdir(request.fspath.dirname)
 
+exported_filenames = frozenset({'basic_token_table.tsv', 'annotated_token_table.tsv', 'annotated_tei.xml'})
+
 @pytest.fixture
 def folder_cleanup(request):
     def inner_folder_cleanup():
-        for filename in ['basic_token_table.tsv', 'annotated_token_table.tsv', 'annotated_tei.xml']:
-            filepath = os.path.join(request.fspath.dirname, filename)
-            if os.path.exists(filepath):
-                os.remove(filepath)
+        with os.scandir(request.fspath.dirname) as entries:
+            for entry in entries:
+                if entry.name in exported_filenames:
+                    try:
+                        os.unlink(entry.path)
+                    except FileNotFoundError:
+                        pass
     return inner_folder_cleanup
 
-@pytest.fixture
+def load_test_project(selected_annotation_collection):
+    # session fixtures are set up before change_test_dir, so the project is loaded from the test directory explicitly
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(os.path.dirname(__file__))
+        return CanspinProject(init_settings={
+            'project_name': 'CATMA_5D2A90F0-4428-41CB-9D3A-E649CD1702C2_CANSpiN',
+            'selected_annotation_collection': selected_annotation_collection,
+            'load_from_gitlab': False,
+            'gitlab_access_token': None
+        })
+
+@pytest.fixture(scope='session')
 def create_canspin_project_1ac():
-    return CanspinProject(init_settings={
-        'project_name': 'CATMA_5D2A90F0-4428-41CB-9D3A-E649CD1702C2_CANSpiN',
-        'selected_annotation_collection': 'Gold AC Gold-Annotation-Test',
-        'load_from_gitlab': False,
-        'gitlab_access_token': None
-    })
+    return load_test_project('Gold AC Gold-Annotation-Test')
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def create_canspin_project_2acs():
-    return CanspinProject(init_settings={
-        'project_name': 'CATMA_5D2A90F0-4428-41CB-9D3A-E649CD1702C2_CANSpiN',
-        'selected_annotation_collection': ['Gold AC Gold-Annotation-Test', 'AC1 Gold-Annotation-Test'],
-        'load_from_gitlab': False,
-        'gitlab_access_token': None
-    })
+    return load_test_project(['Gold AC Gold-Annotation-Test', 'AC1 Gold-Annotation-Test'])
@@ -24,6 +24,11 @@ class TestAnalyzer:
         assert isinstance(result, np.float32)
         assert result > 0.95 and result < 0.96
 
+        # test scalar iaa calculation of the underlying catma project without confusion matrix
+        alpha = analyzer.project.get_iaa(
+            'Gold AC Gold-Annotation-Test', 'AC1 Gold-Annotation-Test', return_confusion_matrix=False)
+        assert alpha > 0.89 and alpha < 0.90
+
     def test_load_tsv_files(
             self,
             create_canspin_project_2acs):
@@ -1,16 +1,84 @@
+import os
+import shutil
+import subprocess
+import pytest
 from gitma_canspin import CatmaProject
 from gitma_canspin.canspin import AnnotationExporter
+from gitma_canspin.project import manifest_file_name, load_manifest, create_local_mirror, clone_with_local_mirror
 
 class TestCanspinProjectInit:
     def test_create_project_instance(self, create_canspin_project_1ac):
         canspin_project = create_canspin_project_1ac
         assert isinstance(canspin_project.project, CatmaProject)
 
+    def test_project_manifest(self, create_canspin_project_1ac):
+        catma_project = create_canspin_project_1ac.project
+        assert os.path.isfile(os.path.join(catma_project.project_root, manifest_file_name))
+
+        manifest = load_manifest(project_root=catma_project.project_root)
+        assert isinstance(manifest, dict)
+        assert len(manifest['collections']) == 4
+        assert [text.uuid for text in catma_project.texts] == manifest['texts']
+
+        reloaded_project = CatmaProject(project_name=catma_project.uuid, included_acs=['Gold AC Gold-Annotation-Test'])
+        assert list(reloaded_project.ac_dict) == list(catma_project.ac_dict)
+
+    def test_outdated_project_manifest(self, create_canspin_project_1ac):
+        catma_project = create_canspin_project_1ac.project
+        collection = load_manifest(project_root=catma_project.project_root)['collections'][0]
+        header_path = os.path.join(catma_project.project_root, 'collections', collection['uuid'], 'header.json')
+        header_stat = os.stat(header_path)
+
+        try:
+            os.utime(header_path, ns=(header_stat.st_atime_ns, header_stat.st_mtime_ns + 1000000000))
+            assert load_manifest(project_root=catma_project.project_root) is None
+
+            CatmaProject(project_name=catma_project.uuid, included_acs=['Gold AC Gold-Annotation-Test'])
+            manifest = load_manifest(project_root=catma_project.project_root)
+            assert isinstance(manifest, dict)
+            rewritten_collection = next(item for item in manifest['collections'] if item['uuid'] == collection['uuid'])
+            assert rewritten_collection['header_mtime'] == os.stat(header_path).st_mtime_ns
+        finally:
+            os.utime(header_path, ns=(header_stat.st_atime_ns, header_stat.st_mtime_ns))
+
+    @pytest.mark.skipif(not shutil.which('git'), reason='git is not installed')
+    def test_local_mirror(self, tmp_path):
+        # create a local origin repository with one commit
+        work_path, origin_path = str(tmp_path / 'work'), str(tmp_path / 'origin.git')
+        subprocess.run(['git', 'init', '--quiet', work_path], check=True)
+        with open(os.path.join(work_path, 'header.json'), 'w', encoding='utf-8') as file:
+            file.write('{}')
+        subprocess.run(['git', '-C', work_path, 'add', 'header.json'], check=True)
+        subprocess.run(['git', '-C', work_path, '-c', 'user.name=test', '-c', 'user.email=test@test', 'commit', '--quiet', '-m', 'init'], check=True)
+        subprocess.run(['git', 'clone', '--bare', '--quiet', work_path, origin_path], check=True)
+
+        # mirror creation from a first clone
+        first_clone_path, mirror_path = str(tmp_path / 'first_clone'), str(tmp_path / 'mirrors' / 'project.git')
+        subprocess.run(['git', 'clone', '--quiet', origin_path, first_clone_path], check=True)
+        create_local_mirror(url=origin_path, path=first_clone_path, mirror_path=mirror_path)
+        assert os.path.isdir(mirror_path)
+        remote_url = subprocess.run(['git', '--git-dir', mirror_path, 'remote', 'get-url', 'origin'], check=True, capture_output=True, text=True).stdout.strip()
+        assert remote_url == origin_path
+
+        # reference clone, dissociated from the mirror
+        second_clone_path = str(tmp_path / 'second_clone')
+        assert clone_with_local_mirror(url=origin_path, path=second_clone_path, mirror_path=mirror_path, gitlab_access_token='token')
+        assert os.path.isfile(os.path.join(second_clone_path, 'header.json'))
+        assert not os.path.exists(os.path.join(second_clone_path, '.git', 'objects', 'info', 'alternates'))
+
+        # an existing clone path is left untouched
+        existing_clone_path = tmp_path / 'existing_clone'
+        existing_clone_path.mkdir()
+        (existing_clone_path / 'precious.json').write_text('{}')
+        assert not clone_with_local_mirror(url=origin_path, path=str(existing_clone_path), mirror_path=mirror_path, gitlab_access_token='token')
+        assert os.listdir(existing_clone_path) == ['precious.json']
+
     def test_tsv_annotations_property(self, create_canspin_project_1ac):
         canspin_project = create_canspin_project_1ac
         assert isinstance(canspin_project.tsv_annotations, dict)
         assert 'cs1' in canspin_project.tsv_annotations
         assert len(canspin_project.tsv_annotations['cs1']) == 1
+        assert canspin_project.tsv_annotations is canspin_project.tsv_annotations
 
     def test_unify_plain_text_line_endings(self, create_canspin_project_1ac):
         auxiliary_exporter = AnnotationExporter(imported_project=create_canspin_project_1ac.project)
@@ -1,8 +1,30 @@
 import os
-import csv
-import codecs
+import pytest
+import spacy
 from lxml import etree
 from gitma_canspin.canspin import AnnotationExporter
+from gitma_canspin._export_annotations import split_text, tokenize_text
+
+cs1_namespace = 'https://www.canspin.uni-rostock.de/ns/CS1/110'
+tei_tag = etree.QName('http://www.tei-c.org/ns/1.0', 'TEI').text
+menge_tag = etree.QName(cs1_namespace, 'Dimensionierung-Menge').text
+annotation_attribute = etree.QName(cs1_namespace, 'annotation').text
+menge_annotation_ids = frozenset({'ED4DC66A-AB87-11EF-946B-4E82A94C69C5', 'ED5FB49F-AB87-11EF-856F-4E82A94C69C5'})
+
+class TeiCheckTarget:
+    """lxml parser target collecting the root tag and the annotation ids of all Dimensionierung-Menge elements."""
+    def __init__(self):
+        self.root_tag = None
+        self.menge_annotations = []
+
+    def start(self, tag, attrib):
+        if self.root_tag is None:
+            self.root_tag = tag
+        if tag == menge_tag:
+            self.menge_annotations.append(attrib.get(annotation_attribute))
+
+    def close(self):
+        return self
 
 class TestExporter:
     def test_test_text_borders(
@@ -11,6 +33,26 @@ class TestExporter:
         exporter = AnnotationExporter(imported_project=create_canspin_project_1ac.project)
         assert exporter.test_text_borders(annotation_collection_index=0, text_borders=(898, 901)) == '"Ein"'
 
+    def test_tokenize_text(self):
+        nlp = spacy.blank('de')
+        text = (
+            'Ein ansehnlicher Theil der beiden Lausitzen, namentlich die früher unter\n'
+            '                     sächsischer Botmäßigkeit stehende Niederlausitz, ist mit unermeßlichen\n'
+            '                     Kieferwaldungen bedeckt, welche unter dem Namen der großen Haide bekannt sind.\n'
+            '»Diese  ungeheuren Wälder«, sagte er – z. B. im Jahr 1830 – , »sind nicht  mehr!«\n\n'
+        ) * 3
+
+        # test chunked tokenization against tokenization of the whole text
+        assert len(list(split_text(text, chunk_len=50))) > 1
+        assert ''.join(split_text(text, chunk_len=50)) == text
+        doc = tokenize_text(nlp=nlp, text=text, chunk_len=50)
+        assert [(t.i, t.idx, t.text, t.whitespace_) for t in doc] == [(t.i, t.idx, t.text, t.whitespace_) for t in nlp(text)]
+
+        # value error test for texts longer than the model's max length
+        nlp.max_length = len(text) - 1
+        with pytest.raises(ValueError, match='exceeds the maximum'):
+            tokenize_text(nlp=nlp, text=text, chunk_len=50)
+
     def test_complete_pipeline(
             self, 
             request, 
@@ -35,22 +77,19 @@ class TestExporter:
         for filename in ['basic_token_table.tsv', 'annotated_token_table.tsv']:
             filepath = os.path.join(request.fspath.dirname, filename)
             with open(filepath, 'r', encoding='utf-8') as file_stream:
-                tsv_data = [row for row in csv.reader(file_stream, delimiter="\t")]
-                assert tsv_data[0][0] == 'Token_ID'
-                assert tsv_data[0][1] == 'Text_Pointer'
-                assert tsv_data[0][2] == 'Token'
-                assert tsv_data[1][0] == '0'
-                assert tsv_data[1][1] == '0'
-                assert tsv_data[1][2] == 'Ein'
+                # only the header and the first row are read, their fields contain no quoted tabs
+                tsv_data = [file_stream.readline().rstrip('\n').split('\t') for _ in range(2)]
+                assert tsv_data[0][:3] == ['Token_ID', 'Text_Pointer', 'Token']
+                assert tsv_data[1][:3] == ['0', '0', 'Ein']
         for filename in ['annotated_tei.xml']:
             filepath = os.path.join(request.fspath.dirname, filename)
-            with codecs.open(filepath, 'r', encoding='utf-8', errors='ignore') as file_stream:
-                root = etree.fromstring(file_stream.read().encode('utf-8'))
-                assert root.tag == '{http://www.tei-c.org/ns/1.0}TEI'
-                menge_elements = root.xpath('//CS1:Dimensionierung-Menge', namespaces={'CS1': 'https://www.canspin.uni-rostock.de/ns/CS1/110'})
-                assert len(menge_elements) == 2
-                assert menge_elements[0].get('{https://www.canspin.uni-rostock.de/ns/CS1/110}annotation') in ['ED4DC66A-AB87-11EF-946B-4E82A94C69C5', 'ED5FB49F-AB87-11EF-856F-4E82A94C69C5']
-                assert menge_elements[1].get('{https://www.canspin.uni-rostock.de/ns/CS1/110}annotation') in ['ED4DC66A-AB87-11EF-946B-4E82A94C69C5', 'ED5FB49F-AB87-11EF-856F-4E82A94C69C5']
+            # the file is streamed through a parser target, so no element tree gets built
+            tei_check = etree.parse(filepath, etree.XMLParser(target=TeiCheckTarget()))
+            assert tei_check.root_tag == tei_tag
+            menge_annotations = tei_check.menge_annotations
+            assert len(menge_annotations) == 2
+            assert menge_annotations[0] in menge_annotation_ids
+            assert menge_annotations[1] in menge_annotation_ids
 
         # delete tsv and tei files
         folder_cleanup()
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from collections import Counter
+from nltk.metrics import AnnotationTask, binary_distance, interval_distance
+from gitma_canspin._metrics import get_iaa_scores, _best_match_numpy
+from gitma_canspin._kernels import best_match
+
+class TestMetrics:
+    def test_get_iaa_scores(self):
+        binary_label_pairs = [
+            ('Ort', 'Ort'), ('Ort', 'Richtung'), ('Richtung', 'Richtung'), ('Ort', None),
+            (None, None), ('Bewegung', 'Ort'), ('Bewegung', 'Bewegung'), ('Ort', 'Ort')
+        ]
+        interval_label_pairs = [(1, 1), (1, 2), (2, 2), (3, 1), (3, 3), (2, 3), (1, 1)]
+
+        # test scores against nltk's AnnotationTask on the same (coder, item, label) data
+        for label_pairs, distance_function in [(binary_label_pairs, binary_distance), (interval_label_pairs, interval_distance)]:
+            data = [
+                (coder, item, label)
+                for item, label_pair in enumerate(label_pairs)
+                for coder, label in enumerate(label_pair)
+            ]
+            task = AnnotationTask(data=data, distance=distance_function)
+            pi, kappa, alpha = get_iaa_scores(label_pairs=Counter(label_pairs), distance_function=distance_function)
+            assert pi == pytest.approx(task.pi())
+            assert kappa == pytest.approx(task.kappa())
+            assert alpha == pytest.approx(task.alpha())
+
+        # zero division error test for a single label
+        with pytest.raises(ZeroDivisionError):
+            get_iaa_scores(label_pairs=Counter([('Ort', 'Ort'), ('Ort', 'Ort')]), distance_function=binary_distance)
+
+    def test_best_match(self):
+        # first spans: no overlap, contains a second span, tie between two second spans, contained in a second span
+        start1, end1 = np.array([0, 10, 30, 50], dtype=np.int64), np.array([5, 20, 40, 52], dtype=np.int64)
+        start2, end2 = np.array([100, 12, 28, 32, 45], dtype=np.int64), np.array([110, 15, 40, 40, 60], dtype=np.int64)
+
+        # test the numba kernel and the numpy fallback, equally good matches resolve to the first index
+        for best_match_function in [best_match, _best_match_numpy]:
+            assert best_match_function(start1, end1, start2, end2).tolist() == [-1, 1, 2, 4]
+            assert best_match_function(start1, end1, start2[:0], end2[:0]).tolist() == [-1, -1, -1, -1]
@@ -8,6 +8,8 @@ class Text:
         project_uuid (str): Name of a CATMA project directory.
         document_uuid (str): Document UUID. Corresponds to the directory name in the "documents" directory.
     """
+    __slots__ = ('uuid', 'title', 'author', 'plain_text')
+
     def __init__(self, project_uuid: str, document_uuid: str):
         #: The text's UUID.
         self.uuid: str = document_uuid